@@ -17,6 +17,7 @@ modules:
 isort:skip_file
 """
 from __future__ import annotations
+import importlib
 from warnings import warn
 from functools import partial
 from toolz import compose
@@ -35,10 +36,7 @@ from gdsfactory.show import show
 from gdsfactory.read.import_gds import import_gds
 from gdsfactory.cross_section import CrossSection, Section
 from gdsfactory.component_layout import Label
-from gdsfactory import decorators
 from gdsfactory import cross_section
-from gdsfactory import labels
-from gdsfactory import asserts
 from gdsfactory import components
 from gdsfactory import routing
 from gdsfactory import typings
@@ -48,8 +46,6 @@ from gdsfactory import read
 from gdsfactory import add_termination
 from gdsfactory import functions
 from gdsfactory import geometry
-from gdsfactory import add_ports
-from gdsfactory import write_cells
 from gdsfactory import add_pins
 from gdsfactory import technology
 from gdsfactory import fill
@@ -79,10 +75,18 @@ from gdsfactory.cross_section import get_cross_section_factories
 c = components
 
 
+# modules that nothing imported above depends on, loaded on first access
+_lazy_modules = ("add_ports", "asserts", "decorators", "labels", "write_cells")
+
+
 def __getattr__(name):
     if name == "types":
         warn("gdsfactory.types has been renamed to gdsfactory.typings")
         return typings
+    if name in _lazy_modules:
+        module = importlib.import_module(f"gdsfactory.{name}")
+        globals()[name] = module
+        return module
     raise AttributeError(f"No module named {name}")
 
 
@@ -67,6 +67,14 @@ def cell_without_validator(func):
 
     I recommend using @cell instead.
     """
+    # the signature and its defaults are fixed, inspect them once per function
+    sig = inspect.signature(func)
+    parameter_names = tuple(sig.parameters.keys())
+    default = {
+        p.name: p.default
+        for p in sig.parameters.values()
+        if p.default != inspect._empty
+    }
 
     @functools.wraps(func)
     def _cell(*args, **kwargs):
@@ -81,16 +89,9 @@ def cell_without_validator(func):
         prefix = kwargs.pop("prefix", func.__name__)
         max_name_length = kwargs.pop("max_name_length", MAX_NAME_LENGTH)
 
-        sig = inspect.signature(func)
-        args_as_kwargs = dict(zip(sig.parameters.keys(), args))
+        args_as_kwargs = dict(zip(parameter_names, args))
         args_as_kwargs.update(kwargs)
 
-        default = {
-            p.name: p.default
-            for p in sig.parameters.values()
-            if p.default != inspect._empty
-        }
-
         changed = args_as_kwargs
         full = default.copy()
         full.update(**args_as_kwargs)
@@ -1079,8 +1079,24 @@ class Component(_GeometryHelper):
             self._register_reference(element)
             self._add(element)
         elif isinstance(element, Iterable):
+            references = []
+            polygons = []
             for subelement in element:
-                self.add(subelement)
+                if isinstance(subelement, ComponentReference):
+                    self._register_reference(subelement)
+                    references.append(subelement)
+                elif isinstance(subelement, Polygon):
+                    polygons.append(subelement)
+                else:
+                    self.add(subelement)
+
+            # insert all references and polygons into the gdstk cell in a single call
+            if references or polygons:
+                self.is_unlocked()
+                self._cell.add(
+                    *[reference._reference for reference in references], *polygons
+                )
+                self._references.extend(references)
         else:
             self._add(element)
 
@@ -109,7 +109,14 @@ def _parse_layer(layer):
         (gds_layer, gds_datatype) : array-like[2]
             The layer number and datatype of the input.
     """
-    if hasattr(layer, "gds_layer"):
+    if (
+        isinstance(layer, tuple)
+        and len(layer) == 2
+        and isinstance(layer[0], int)
+        and isinstance(layer[1], int)
+    ):  # resolved layer, skip the np.shape calls below
+        gds_layer, gds_datatype = layer
+    elif hasattr(layer, "gds_layer"):
         gds_layer, gds_datatype = layer.gds_layer, layer.gds_datatype
     elif np.shape(layer) == (2,):  # In form [3,0]
         gds_layer, gds_datatype = layer[0], layer[1]
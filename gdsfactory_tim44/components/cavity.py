@@ -13,6 +13,7 @@ def cavity(
     coupler: ComponentSpec = "coupler",
     length: float = 0.1,
     gap: float = 0.2,
+    copy_info: bool = True,
     **kwargs,
 ) -> Component:
     r"""Returns  cavity from a coupler and a mirror.
@@ -25,6 +26,8 @@ def cavity(
         coupler: coupler library.
         length: coupler length.
         gap: coupler gap.
+        copy_info: copy the mirror info and settings into the cavity.
+            False skips it for geometry-only flows that do not read info.
         kwargs: coupler_settings.
 
     .. code::
@@ -51,7 +54,8 @@ def cavity(
     mr.connect("o1", destination=cr.ports["o3"])
     c.add_port("o1", port=cr.ports["o1"])
     c.add_port("o2", port=cr.ports["o4"])
-    c.copy_child_info(mirror)
+    if copy_info:
+        c.copy_child_info(mirror)
     return c
 
 
@@ -77,14 +77,17 @@ def coupler_ring(
     cbl.mirror(p1=(0, y), p2=(1, y))
     cbl.connect(port="o2", destination=cs.ports["o2"])
 
-    c.add_port("o1", port=cbl.ports["o3"])
-    c.add_port("o2", port=cbl.ports["o4"])
+    # optical ports already in clockwise order, as auto_rename_ports would name them
+    c.add_port("o1", port=cbl.ports["o4"])
+    c.add_port("o2", port=cbl.ports["o3"])
     c.add_port("o3", port=cbr.ports["o3"])
     c.add_port("o4", port=cbr.ports["o4"])
 
-    c.add_ports(cbl.get_ports_list(port_type="electrical"), prefix="cbl")
-    c.add_ports(cbr.get_ports_list(port_type="electrical"), prefix="cbr")
-    c.auto_rename_ports()
+    electrical_ports_cbl = cbl.get_ports_list(port_type="electrical")
+    if electrical_ports_cbl:
+        c.add_ports(electrical_ports_cbl, prefix="cbl")
+        c.add_ports(cbr.get_ports_list(port_type="electrical"), prefix="cbr")
+        c.auto_rename_ports()
     return c
 
 
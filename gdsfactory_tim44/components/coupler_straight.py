@@ -27,12 +27,16 @@ def coupler_straight(
     # bot.ymax = 0
     # top.ymin = gap
 
-    top.movey(straight_component.info["width"] + gap)
-
-    component.add_port("o1", port=bot.ports["o1"])
-    component.add_port("o2", port=top.ports["o1"])
-    component.add_port("o3", port=bot.ports["o2"])
-    component.add_port("o4", port=top.ports["o2"])
+    width = straight_component.info["width"]
+    top.movey(width + gap)
+
+    # each access to ref.ports transforms all ports, so fetch them once
+    bp = bot.ports
+    tp = top.ports
+    component.add_port("o1", port=bp["o1"])
+    component.add_port("o2", port=tp["o1"])
+    component.add_port("o3", port=bp["o2"])
+    component.add_port("o4", port=tp["o2"])
     component.auto_rename_ports()
     return component
 
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import Tuple
 
+import numpy as np
+
 import gdsfactory as gf
 from gdsfactory.typings import LayerSpec
 
@@ -30,13 +32,23 @@ def litho_ruler(
         layer: Specific layer to put the ruler geometry on.
     """
     D = gf.Component()
-    for n in range(num_marks):
-        h = height * scale[n % len(scale)]
-        D << gf.components.rectangle(size=(width, h), layer=layer)
-
-    D.distribute(direction="x", spacing=spacing, separation=False, edge="x")
-    D.align(alignment="ymin")
-    D.flatten()
+    n = np.arange(num_marks)
+    heights = height * np.asarray(scale, dtype=float)[n % len(scale)]
+    xmin = n * spacing
+    xmax = xmin + width
+    zeros = np.zeros(num_marks)
+
+    # (num_marks, 4, 2) corners: (xmin, 0), (xmax, 0), (xmax, h), (xmin, h)
+    points = np.stack(
+        [
+            np.stack([xmin, zeros], axis=-1),
+            np.stack([xmax, zeros], axis=-1),
+            np.stack([xmax, heights], axis=-1),
+            np.stack([xmin, heights], axis=-1),
+        ],
+        axis=1,
+    )
+    D.add_polygon(points, layer=layer)
     return D
 
 
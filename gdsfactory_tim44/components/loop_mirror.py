@@ -6,7 +6,6 @@ import gdsfactory as gf
 from gdsfactory.component import Component
 from gdsfactory.components.mmi1x2 import mmi1x2
 from gdsfactory.components.spiral_external_io import spiral_external_io
-from gdsfactory.routing.manhattan import route_manhattan
 from gdsfactory.typings import ComponentSpec
 
 
@@ -21,6 +20,8 @@ def loop_mirror(
         bend90: 90 deg bend.
 
     """
+    from gdsfactory.routing.manhattan import route_manhattan
+
     c = Component()
     component = gf.get_component(component)
     bend90 = gf.get_component(bend90)
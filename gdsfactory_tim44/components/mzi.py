@@ -89,57 +89,70 @@ def mzi(
     bend_spec = bend
     bend = gf.get_component(bend, cross_section=cross_section)
 
+    straights_y = {}
+
+    def get_straight_y(length: float) -> Component:
+        """Returns one straight_y per length, so equal arms share a cell."""
+        if length not in straights_y:
+            straights_y[length] = gf.get_component(
+                straight_y, length=length, cross_section=cross_section
+            )
+        return straights_y[length]
+
     c = Component()
     cp1 = gf.get_component(splitter)
-    cp2 = gf.get_component(combiner) if combiner else cp1
+    cp2 = cp1 if combiner is splitter else gf.get_component(combiner)
 
     if with_splitter:
-        cp1 = c << cp1
+        cp1 = c.add_ref(cp1, alias="cp1")
+    # without splitter cp1 stays the unplaced cell, only its port positions are used
 
-    cp2 = c << cp2
+    cp2 = c.add_ref(cp2, alias="cp2")
     b5 = c << bend
     b5.mirror()
     b5.connect("o1", cp1.ports[port_e0_splitter])
 
-    syl = c << gf.get_component(
-        straight_y, length=delta_length / 2 + length_y, cross_section=cross_section
-    )
+    syl = c.add_ref(get_straight_y(delta_length / 2 + length_y), alias="syl")
     syl.connect("o1", b5.ports["o2"])
     b6 = c << bend
     b6.connect("o1", syl.ports["o2"])
 
-    straight_x_bot = (
+    straight_x_bot_component = (
         gf.get_component(
             straight_x_bot, length=length_x, cross_section=cross_section_x_bot
         )
         if length_x
         else gf.get_component(straight_x_bot)
     )
-    sxb = c << straight_x_bot
+    sxb = c.add_ref(straight_x_bot_component, alias="sxb")
     sxb.connect("o1", b6.ports["o2"])
 
     b1 = c << bend
     b1.connect("o1", cp1.ports[port_e1_splitter])
 
-    sytl = c << gf.get_component(
-        straight_y, length=length_y, cross_section=cross_section
-    )
+    sytl = c.add_ref(get_straight_y(length_y), alias="sytl")
     sytl.connect("o1", b1.ports["o2"])
 
     b2 = c << bend
     b2.connect("o2", sytl.ports["o2"])
-    straight_x_top = (
-        gf.get_component(
-            straight_x_top, length=length_x, cross_section=cross_section_x_top
+    if straight_x_top is straight_x_bot and (
+        not length_x or cross_section_x_top is cross_section_x_bot
+    ):
+        straight_x_top_component = straight_x_bot_component
+    else:
+        straight_x_top_component = (
+            gf.get_component(
+                straight_x_top, length=length_x, cross_section=cross_section_x_top
+            )
+            if length_x
+            else gf.get_component(straight_x_top)
         )
-        if length_x
-        else gf.get_component(straight_x_top)
-    )
-    sxt = c << straight_x_top
+    sxt = c.add_ref(straight_x_top_component, alias="sxt")
     sxt.connect("o1", b2.ports["o1"])
 
     cp2.mirror()
-    cp2.xmin = sxt.ports["o2"].x + bend.info["radius"] * nbends + 0.1
+    radius = bend.info["radius"]
+    cp2.xmin = sxt.ports["o2"].x + radius * nbends + 0.1
 
     route = get_route(
         sxt.ports["o2"],
@@ -159,19 +172,14 @@ def mzi(
     )
     c.add(route.references)
 
-    sytl.name = "sytl"
-    syl.name = "syl"
-    sxt.name = "sxt"
-    sxb.name = "sxb"
-    cp1.name = "cp1"
-    cp2.name = "cp2"
-
     if with_splitter:
-        c.add_ports(cp1.get_ports_list(orientation=180), prefix="in")
+        c.add_ports(
+            [p for p in cp1.ports.values() if p.orientation == 180], prefix="in"
+        )
     else:
         c.add_port("o1", port=b1.ports["o1"])
         c.add_port("o2", port=b5.ports["o1"])
-    c.add_ports(cp2.get_ports_list(orientation=0), prefix="out")
+    c.add_ports([p for p in cp2.ports.values() if p.orientation == 0], prefix="out")
     c.add_ports(sxt.get_ports_list(port_type="electrical"), prefix="top")
     c.add_ports(sxb.get_ports_list(port_type="electrical"), prefix="bot")
     c.auto_rename_ports()
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from functools import lru_cache
+from typing import Tuple
+
 import numpy as np
 from numpy import cos, pi, sin
 
@@ -8,6 +11,18 @@ from gdsfactory.component import Component
 from gdsfactory.typings import LayerSpec
 
 
+@lru_cache(maxsize=32)
+def _unit_circle(angle_resolution: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns read-only cos(t), sin(t) shared by rings with the same resolution."""
+    n = int(np.round(360 / angle_resolution))
+    t = np.linspace(0, 360, n + 1) * pi / 180
+    cos_t = cos(t)
+    sin_t = sin(t)
+    cos_t.flags.writeable = False
+    sin_t.flags.writeable = False
+    return cos_t, sin_t
+
+
 @gf.cell
 def ring(
     radius: float = 10.0,
@@ -26,15 +41,16 @@ def ring(
     D = gf.Component()
     inner_radius = radius - width / 2
     outer_radius = radius + width / 2
-    n = int(np.round(360 / angle_resolution))
-    t = np.linspace(0, 360, n + 1) * pi / 180
-    inner_points_x = (inner_radius * cos(t)).tolist()
-    inner_points_y = (inner_radius * sin(t)).tolist()
-    outer_points_x = (outer_radius * cos(t)).tolist()
-    outer_points_y = (outer_radius * sin(t)).tolist()
-    xpts = inner_points_x + outer_points_x[::-1]
-    ypts = inner_points_y + outer_points_y[::-1]
-    D.add_polygon(points=(xpts, ypts), layer=layer)
+    cos_t, sin_t = _unit_circle(angle_resolution)
+    n = len(cos_t) - 1
+
+    # inner circle forward, outer circle backward
+    points = np.empty((2 * (n + 1), 2))
+    np.multiply(cos_t, inner_radius, out=points[: n + 1, 0])
+    np.multiply(sin_t, inner_radius, out=points[: n + 1, 1])
+    np.multiply(cos_t[::-1], outer_radius, out=points[n + 1 :, 0])
+    np.multiply(sin_t[::-1], outer_radius, out=points[n + 1 :, 1])
+    D.add_polygon(points=points, layer=layer)
     return D
 
 
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import numpy as np
+
 import gdsfactory as gf
 from gdsfactory.component import Component
 from gdsfactory.typings import ComponentSpec, Floats, LayerSpec, Optional
@@ -69,12 +71,14 @@ def straight_heater_meander(
     straight_length = gf.snap.snap_to_grid(
         (length - (rows - 1) * route.length) / rows, nm=2
     )
-    ports = {}
+    # ports[0][row] is the west (o1) port of row, ports[1][row] the east (o2) port
+    ports = [[None] * rows, [None] * rows]
 
     """
     Straights
     """
-    for row, straight_width in enumerate(straight_widths):
+
+    def get_straight_with_tapers(straight_width: float) -> Component:
         cross_section1 = gf.get_cross_section(cross_section, width=straight_width)
         straight = gf.c.straight(
             length=straight_length - 2 * taper_length, cross_section=cross_section1
@@ -87,57 +91,77 @@ def straight_heater_meander(
             length=taper_length,
         )
 
-        straight_with_tapers = gf.c.extend_ports(straight, extension=taper)
+        return gf.c.extend_ports(straight, extension=taper)
 
-        straight_ref = c << straight_with_tapers
-        straight_ref.y = row * spacing
-        ports[f"o1_{row+1}"] = straight_ref.ports["o1"]
-        ports[f"o2_{row+1}"] = straight_ref.ports["o2"]
+    straights_with_tapers = {
+        straight_width: get_straight_with_tapers(straight_width)
+        for straight_width in set(straight_widths)
+    }
+
+    if len(straights_with_tapers) == 1:
+        # all rows are identical: write one array reference instead of rows refs
+        straight_with_tapers = straights_with_tapers[straight_widths[0]]
+        straight_array = c.add_array(
+            straight_with_tapers, columns=1, rows=rows, spacing=(0, spacing)
+        )
+        straight_array.movey(-straight_with_tapers.y)
+        for row in range(rows):
+            dy = row * spacing - straight_with_tapers.y
+            for side, port_name in enumerate(("o1", "o2")):
+                port = straight_with_tapers.ports[port_name].copy()
+                port.move((0, dy))
+                ports[side][row] = port
+
+    else:
+        for row, straight_width in enumerate(straight_widths):
+            straight_ref = c << straights_with_tapers[straight_width]
+            straight_ref.y = row * spacing
+            ports[0][row] = straight_ref.ports["o1"]
+            ports[1][row] = straight_ref.ports["o2"]
 
     """
     Loopbacks
     """
+    straights = {}
+
+    def get_straight(length: float) -> Component:
+        """Returns one straight per length (1nm resolution), reused in this build."""
+        key = round(length * 1e3)
+        if key not in straights:
+            straights[key] = gf.c.straight(length=length, cross_section=cross_section)
+        return straights[key]
+
+    def extend(port: gf.Port, length: float) -> gf.Port:
+        """Returns the end port of a straight of length connected to port."""
+        if length <= 0:
+            return port
+        extra_straight = c << get_straight(length)
+        extra_straight.connect("o1", port)
+        return extra_straight.ports["o2"]
+
     for row in range(1, rows, 2):
         extra_length = 3 * (rows - row - 1) / 2 * radius
-        extra_straight1 = c << gf.c.straight(
-            length=extra_length, cross_section=cross_section
-        )
-        extra_straight1.connect("o1", ports[f"o1_{row+1}"])
-        extra_straight2 = c << gf.c.straight(
-            length=extra_length, cross_section=cross_section
-        )
-        extra_straight2.connect("o1", ports[f"o1_{row+2}"])
-
         route = gf.routing.get_route(
-            extra_straight1.ports["o2"],
-            extra_straight2.ports["o2"],
+            extend(ports[0][row], extra_length),
+            extend(ports[0][row + 1], extra_length),
             radius=radius,
             cross_section=cross_section,
         )
         c.add(route.references)
 
         extra_length = 3 * (row - 1) / 2 * radius
-        extra_straight1 = c << gf.c.straight(
-            length=extra_length, cross_section=cross_section
-        )
-        extra_straight1.connect("o1", ports[f"o2_{row+1}"])
-        extra_straight2 = c << gf.c.straight(
-            length=extra_length, cross_section=cross_section
-        )
-        extra_straight2.connect("o1", ports[f"o2_{row}"])
-
         route = gf.routing.get_route(
-            extra_straight1.ports["o2"],
-            extra_straight2.ports["o2"],
+            extend(ports[1][row], extra_length),
+            extend(ports[1][row - 1], extra_length),
             radius=radius,
             cross_section=cross_section,
         )
         c.add(route.references)
 
-    straight1 = c << gf.c.straight(length=extension_length, cross_section=cross_section)
-    straight2 = c << gf.c.straight(length=extension_length, cross_section=cross_section)
-    straight1.connect("o2", ports["o1_1"])
-    straight2.connect("o1", ports[f"o2_{rows}"])
+    straight1 = c << get_straight(extension_length)
+    straight2 = c << get_straight(extension_length)
+    straight1.connect("o2", ports[0][0])
+    straight2.connect("o1", ports[1][-1])
 
     c.add_port("o1", port=straight1.ports["o1"])
     c.add_port("o2", port=straight2.ports["o2"])
@@ -156,22 +180,22 @@ def straight_heater_meander(
     if layer_heater and via_stack:
         via_stacke = via_stackw = gf.get_component(via_stack)
         dx = via_stackw.get_ports_xsize() / 2 + heater_taper_length or 0
-        via_stack_west_center = heater.size_info.cw - (dx, 0)
-        via_stack_east_center = heater.size_info.ce + (dx, 0)
-
-        via_stack_east_center = gf.snap.snap_to_grid(via_stack_east_center, nm=10)
-        via_stack_west_center = gf.snap.snap_to_grid(via_stack_west_center, nm=10)
+        heater_size_info = heater.size_info
+        via_stack_west_center, via_stack_east_center = gf.snap.snap_to_grid(
+            np.array([heater_size_info.cw - (dx, 0), heater_size_info.ce + (dx, 0)]),
+            nm=10,
+        )
 
         via_stack_west = c << via_stackw
         via_stack_east = c << via_stacke
         via_stack_west.move(via_stack_west_center)
         via_stack_east.move(via_stack_east_center)
-        c.add_port(
-            "e1", port=via_stack_west.get_ports_list(orientation=port_orientation1)[0]
-        )
-        c.add_port(
-            "e2", port=via_stack_east.get_ports_list(orientation=port_orientation2)[0]
-        )
+        # both via stacks are translations of one cell: index its ports once
+        port_names = {}
+        for port in via_stackw.ports.values():
+            port_names.setdefault(port.orientation % 360, port.name)
+        c.add_port("e1", port=via_stack_west.ports[port_names[port_orientation1 % 360]])
+        c.add_port("e2", port=via_stack_east.ports[port_names[port_orientation2 % 360]])
 
         if heater_taper_length:
             taper = gf.c.taper(
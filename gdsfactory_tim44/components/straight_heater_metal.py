@@ -5,6 +5,7 @@ from typing import Optional
 import gdsfactory as gf
 from gdsfactory.cell import cell
 from gdsfactory.component import Component
+from gdsfactory.component_reference import ComponentReference
 from gdsfactory.typings import ComponentSpec, CrossSectionSpec
 
 
@@ -51,65 +52,86 @@ def straight_heater_metal_undercut(
     """
     period = length_undercut + length_undercut_spacing
     n = int((length - 2 * length_straight_input) // period)
+    if n < 0:
+        raise ValueError(
+            f"length = {length} needs to be >= 2 * length_straight_input = "
+            f"{2 * length_straight_input}"
+        )
 
-    length_straight_input = (length - n * period) / 2
+    c = Component()
 
-    s_si = gf.components.straight(
-        cross_section=cross_section_waveguide_heater,
-        length=length_straight_input,
-        heater_width=heater_width,
-        **kwargs,
-    )
-    cross_section_undercut = (
-        cross_section_heater_undercut
-        if with_undercut
-        else cross_section_waveguide_heater
-    )
-    s_uc = gf.components.straight(
-        cross_section=cross_section_undercut,
-        length=length_undercut,
-        heater_width=heater_width,
-        **kwargs,
-    )
-    s_spacing = gf.components.straight(
-        cross_section=cross_section_waveguide_heater,
-        length=length_undercut_spacing,
-        heater_width=heater_width,
-        **kwargs,
-    )
-    symbol_to_component = {
-        "-": (s_si, "o1", "o2"),
-        "U": (s_uc, "o1", "o2"),
-        "H": (s_spacing, "o1", "o2"),
-    }
+    if n == 0:
+        # no undercut fits: a single heated straight over the full length
+        s_si = gf.components.straight(
+            cross_section=cross_section_waveguide_heater,
+            length=length,
+            heater_width=heater_width,
+            **kwargs,
+        )
+        ref_first = ref_last = c.add_ref(s_si)
+        x_last = 0
 
-    # Each character in the sequence represents a component
-    sequence = "-" + n * "UH" + "-"
+    else:
+        length_straight_input = (length - n * period) / 2
 
-    c = Component()
-    sequence = gf.components.component_sequence(
-        sequence=sequence, symbol_to_component=symbol_to_component
-    )
-    c.add_ref(sequence)
-    c.add_ports(sequence.ports)
+        s_si = gf.components.straight(
+            cross_section=cross_section_waveguide_heater,
+            length=length_straight_input,
+            heater_width=heater_width,
+            **kwargs,
+        )
+        cross_section_undercut = (
+            cross_section_heater_undercut
+            if with_undercut
+            else cross_section_waveguide_heater
+        )
+        s_uc = gf.components.straight(
+            cross_section=cross_section_undercut,
+            length=length_undercut,
+            heater_width=heater_width,
+            **kwargs,
+        )
+        s_spacing = gf.components.straight(
+            cross_section=cross_section_waveguide_heater,
+            length=length_undercut_spacing,
+            heater_width=heater_width,
+            **kwargs,
+        )
+
+        # place the "-" + n * "UH" + "-" sequence directly, each straight has o1 at x=0
+        ref_first = c.add_ref(s_si)
+        sections = []
+        for i in range(n):
+            x = length_straight_input + i * period
+            sections.append(ComponentReference(s_uc, origin=(x, 0)))
+            sections.append(
+                ComponentReference(s_spacing, origin=(x + length_undercut, 0))
+            )
+        c.add(sections)
+        x_last = length_straight_input + n * period
+        ref_last = c.add_ref(s_si).movex(x_last)
+
+    c.add_port("o1", port=ref_first.ports["o1"])
+    c.add_port("o2", port=ref_last.ports["o2"])
 
     if via_stack:
-        refs = list(sequence.named_references.keys())
         via_stackw = via_stacke = gf.get_component(via_stack)
-        via_stack_west_center = sequence.named_references[refs[0]].size_info.cw
-        via_stack_east_center = sequence.named_references[refs[-1]].size_info.ce
+        # first and last refs are the same cell, so one bbox gives both ends
+        s_si_size_info = s_si.size_info
+        via_stack_west_center = s_si_size_info.cw
+        via_stack_east_center = s_si_size_info.ce + (x_last, 0)
         dx = via_stackw.get_ports_xsize() / 2 + heater_taper_length or 0
 
         via_stack_west = c << via_stackw
         via_stack_east = c << via_stacke
         via_stack_west.move(via_stack_west_center - (dx, 0))
         via_stack_east.move(via_stack_east_center + (dx, 0))
-        c.add_port(
-            "e1", port=via_stack_west.get_ports_list(orientation=port_orientation1)[0]
-        )
-        c.add_port(
-            "e2", port=via_stack_east.get_ports_list(orientation=port_orientation2)[0]
-        )
+        # both via stacks are translations of one cell: index its ports once
+        port_names = {}
+        for port in via_stackw.ports.values():
+            port_names.setdefault(port.orientation % 360, port.name)
+        c.add_port("e1", port=via_stack_west.ports[port_names[port_orientation1 % 360]])
+        c.add_port("e2", port=via_stack_east.ports[port_names[port_orientation2 % 360]])
         if heater_taper_length:
             x = gf.get_cross_section(cross_section_heater, width=heater_width)
             taper = gf.components.taper(
@@ -69,18 +69,17 @@ def straight_pin(
         c.add_ports(wg.get_ports_list())
 
     via_stack_length = length
-    via_stack_top = c << via_stack(
+    via_stack_component = via_stack(
         size=(via_stack_length, via_stack_width),
     )
-    via_stack_bot = c << via_stack(
-        size=(via_stack_length, via_stack_width),
-    )
-
-    via_stack_bot.xmin = wg.xmin
-    via_stack_top.xmin = wg.xmin
-
-    via_stack_top.ymin = +via_stack_spacing / 2
-    via_stack_bot.ymax = -via_stack_spacing / 2
+    via_stack_top = c << via_stack_component
+    via_stack_bot = c << via_stack_component
+
+    # both references share one cell, so its bbox gives both displacements
+    (xmin, ymin), (_, ymax) = via_stack_component.bbox
+    dx = wg.xmin - xmin
+    via_stack_top.move((dx, +via_stack_spacing / 2 - ymin))
+    via_stack_bot.move((dx, -via_stack_spacing / 2 - ymax))
 
     c.add_ports(via_stack_bot.ports, prefix="bot_")
     c.add_ports(via_stack_top.ports, prefix="top_")
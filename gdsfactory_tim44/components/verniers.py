@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import numpy as np
+
 import gdsfactory as gf
 from gdsfactory.component import Component
 from gdsfactory.typings import Floats, LayerSpec
@@ -14,14 +16,15 @@ def verniers(
     **kwargs,
 ) -> Component:
     c = gf.Component()
-    y = 0
+    widths = np.asarray(widths, dtype=float)
+    # each straight is centered after all previous widths and gaps
+    ys = np.cumsum(widths) - widths / 2 + gap * np.arange(len(widths))
+    labels = (widths * 1e3).astype(int)
 
-    for width in widths:
+    for width, y, label in zip(widths.tolist(), ys.tolist(), labels.tolist()):
         w = c << gf.components.straight(width=width, length=xsize, **kwargs)
-        y += width / 2
         w.y = y
-        c.add_label(text=str(int(width * 1e3)), position=(0, y), layer=layer_label)
-        y += width / 2 + gap
+        c.add_label(text=str(label), position=(0, y), layer=layer_label)
 
     return c
 
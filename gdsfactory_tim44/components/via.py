@@ -2,11 +2,23 @@ from __future__ import annotations
 
 from typing import Optional, Tuple
 
+import gdstk
+
 import gdsfactory as gf
 from gdsfactory.component import Component
+from gdsfactory.component_layout import _parse_layer
 from gdsfactory.typings import LayerSpec
 
 
+def _rectangle(a: float, b: float, layer: LayerSpec) -> Optional[gdstk.Polygon]:
+    """Returns a 2a x 2b rectangle centered at the origin, None for no layer."""
+    layer = gf.pdk.get_layer(layer)
+    if layer is None:
+        return None
+    gds_layer, gds_datatype = _parse_layer(layer)
+    return gdstk.rectangle((-a, -b), (a, b), layer=gds_layer, datatype=gds_datatype)
+
+
 @gf.cell
 def via(
     size: Tuple[float, float] = (0.7, 0.7),
@@ -60,14 +72,14 @@ def via(
     width, height = size
     a = width / 2
     b = height / 2
-    c.add_polygon([(-a, -b), (a, -b), (a, b), (-a, b)], layer=layer)
+    rectangles = [_rectangle(a, b, layer)]
 
-    bbox_layers = bbox_layers or []
-    a = (width + bbox_offset) / 2
-    b = (height + bbox_offset) / 2
-    for layer in bbox_layers:
-        c.add_polygon([(-a, -b), (a, -b), (a, b), (-a, b)], layer=layer)
+    if bbox_layers:
+        a = (width + bbox_offset) / 2
+        b = (height + bbox_offset) / 2
+        rectangles += [_rectangle(a, b, layer) for layer in bbox_layers]
 
+    c.add([rectangle for rectangle in rectangles if rectangle is not None])
     return c
 
 
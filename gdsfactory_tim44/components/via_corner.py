@@ -1,9 +1,8 @@
 from __future__ import annotations
 
+from math import floor
 from typing import Tuple
 
-from numpy import floor
-
 import gdsfactory as gf
 from gdsfactory.components.compass import compass
 from gdsfactory.components.via import via1
@@ -75,8 +74,8 @@ def via_corner(
         nb_vias_x = (min_width - w - 2 * g) / pitch_x + 1
         nb_vias_y = (min_height - h - 2 * g) / pitch_y + 1
 
-        nb_vias_x = int(floor(nb_vias_x)) or 1
-        nb_vias_y = int(floor(nb_vias_y)) or 1
+        nb_vias_x = floor(nb_vias_x) or 1
+        nb_vias_y = floor(nb_vias_y) or 1
         ref = c.add_array(
             via, columns=nb_vias_x, rows=nb_vias_y, spacing=(pitch_x, pitch_y)
         )
@@ -1,9 +1,8 @@
 from __future__ import annotations
 
+from math import floor
 from typing import Optional, Tuple
 
-from numpy import floor
-
 import gdsfactory as gf
 from gdsfactory.component import Component
 from gdsfactory.components.compass import compass
@@ -75,8 +74,8 @@ def via_stack(
             nb_vias_x = (width - w - 2 * g) / pitch_x + 1
             nb_vias_y = (height - h - 2 * g) / pitch_y + 1
 
-            nb_vias_x = int(floor(nb_vias_x)) or 1
-            nb_vias_y = int(floor(nb_vias_y)) or 1
+            nb_vias_x = floor(nb_vias_x) or 1
+            nb_vias_y = floor(nb_vias_y) or 1
             ref = c.add_array(
                 via_type, columns=nb_vias_x, rows=nb_vias_y, spacing=(pitch_x, pitch_y)
             )
@@ -159,8 +158,8 @@ def via_stack_from_rules(
             nb_vias_x = (width - w - 2 * g) / pitch_x + 1
             nb_vias_y = (height - h - 2 * g) / pitch_y + 1
 
-            nb_vias_x = int(floor(nb_vias_x)) or 1
-            nb_vias_y = int(floor(nb_vias_y)) or 1
+            nb_vias_x = floor(nb_vias_x) or 1
+            nb_vias_y = floor(nb_vias_y) or 1
             ref = c.add_array(
                 via_type, columns=nb_vias_x, rows=nb_vias_y, spacing=(pitch_x, pitch_y)
             )
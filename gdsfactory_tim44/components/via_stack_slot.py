@@ -1,9 +1,9 @@
 from __future__ import annotations
 
+from itertools import chain, repeat
+from math import floor
 from typing import Optional
 
-from numpy import floor
-
 import gdsfactory as gf
 from gdsfactory.component import Component
 from gdsfactory.components.compass import compass
@@ -81,8 +81,8 @@ def via_stack_slot(
     layer_offsetsx = layer_offsetsx or layer_offsets
     layer_offsetsy = layer_offsetsy or layer_offsets
 
-    layer_offsetsx = list(layer_offsetsx) + [0] * len(layers)
-    layer_offsetsy = list(layer_offsetsy) + [0] * len(layers)
+    layer_offsetsx = chain(layer_offsetsx, repeat(0))
+    layer_offsetsy = chain(layer_offsetsy, repeat(0))
 
     for layer, offsetx, offsety in zip(layers, layer_offsetsx, layer_offsetsy):
         ref = c << compass(
@@ -95,8 +95,11 @@ def via_stack_slot(
     via = gf.get_component(via, size=(size[0] - 2 * enclosure, ysize))
 
     nb_vias_y = (size[1] - 2 * enclosure) / yspacing
-    nb_vias_y = int(floor(nb_vias_y)) or 1
-    ref = c.add_array(via, columns=1, rows=nb_vias_y, spacing=(0, yspacing))
+    nb_vias_y = floor(nb_vias_y) or 1
+    if nb_vias_y == 1:
+        ref = c << via
+    else:
+        ref = c.add_array(via, columns=1, rows=nb_vias_y, spacing=(0, yspacing))
     dy = (size[1] - (nb_vias_y - 1) * yspacing - size[1]) / 2
     ref.move((0, dy))
     return c
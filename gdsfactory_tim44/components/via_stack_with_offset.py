@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from typing import Optional, Tuple
+from math import floor
+from typing import NamedTuple, Optional, Tuple
 
-from numpy import floor
+import numpy as np
 
 import gdsfactory as gf
 from gdsfactory.component import Component
@@ -10,6 +11,22 @@ from gdsfactory.components.via import viac
 from gdsfactory.typings import ComponentSpec, LayerSpecs
 
 
+class _ViaInfo(NamedTuple):
+    component: Component
+    w: float
+    h: float
+    enclosure: float
+    pitch_x: float
+    pitch_y: float
+
+
+def _get_via_info(via: ComponentSpec) -> _ViaInfo:
+    via = gf.get_component(via)
+    w, h = via.info["size"]
+    pitch_x, pitch_y = via.info["spacing"]
+    return _ViaInfo(via, w, h, via.info["enclosure"], pitch_x, pitch_y)
+
+
 @gf.cell
 def via_stack_with_offset(
     layers: LayerSpecs = ("PPP", "M1"),
@@ -27,30 +44,43 @@ def via_stack_with_offset(
         offsets: for next layer.
         port_orientation: 180: W0, 0: E0, 90: N0, 270: S0.
     """
+    if port_orientation not in [0, 90, 270, 180]:
+        raise ValueError(
+            f"Invalid port_orientation = {port_orientation} not in [0, 90, 180, 270]"
+        )
+
     c = Component()
     y0 = y1 = 0
 
     offsets = offsets or [0] * len(layers)
 
-    for layer, via, size, offset in zip(layers, vias, sizes, offsets):
+    # resolve each via spec once, layers often share the same via
+    via_infos = {}
+    for via in vias:
+        if via and id(via) not in via_infos:
+            via_infos[id(via)] = _get_via_info(via)
+
+    # two rectangles per layer, added with one add_polygon per resolved layer
+    rectangles = np.empty((2 * len(layers), 4, 2), dtype=np.float64)
+    layer_to_indices = {}
+
+    for i, (layer, via, size, offset) in enumerate(zip(layers, vias, sizes, offsets)):
         width, height = size
         x0 = -width / 2
         x1 = +width / 2
         y1 = y0 + height
-        rect_pts = [(x0, y0), (x1, y0), (x1, y1), (x0, y1)]
-        c.add_polygon(rect_pts, layer=layer)
+        rectangles[2 * i, :, 0] = (x0, x1, x1, x0)
+        rectangles[2 * i, :, 1] = (y0, y0, y1, y1)
+        layer_to_indices.setdefault(gf.get_layer(layer), []).extend((2 * i, 2 * i + 1))
 
         if via:
-            via = gf.get_component(via)
-            w, h = via.info["size"]
-            enclosure = via.info["enclosure"]
-            pitch_x, pitch_y = via.info["spacing"]
+            via, w, h, enclosure, pitch_x, pitch_y = via_infos[id(via)]
 
             nb_vias_x = (width - w - 2 * enclosure) / pitch_x + 1
             nb_vias_y = (height - h - 2 * enclosure) / pitch_y + 1
 
-            nb_vias_x = int(floor(nb_vias_x)) or 1
-            nb_vias_y = int(floor(nb_vias_y)) or 1
+            nb_vias_x = floor(nb_vias_x) or 1
+            nb_vias_y = floor(nb_vias_y) or 1
 
             cw = (width - (nb_vias_x - 1) * pitch_x - w) / 2
             ch = (height - (nb_vias_y - 1) * pitch_y - h) / 2
@@ -58,22 +88,24 @@ def via_stack_with_offset(
             x00 = x0 + cw + w / 2
             y00 = y0 + ch + h / 2 + offset
 
-            ref = c.add_array(
-                via, columns=nb_vias_x, rows=nb_vias_y, spacing=(pitch_x, pitch_y)
-            )
+            if nb_vias_x == nb_vias_y == 1:
+                ref = c << via
+            else:
+                ref = c.add_array(
+                    via, columns=nb_vias_x, rows=nb_vias_y, spacing=(pitch_x, pitch_y)
+                )
             ref.move((x00, y00))
 
         y0 += offset
         y1 = y0 + height
-        rect_pts = [(x0, y0), (x1, y0), (x1, y1), (x0, y1)]
-        c.add_polygon(rect_pts, layer=layer)
+        rectangles[2 * i + 1, :, 0] = (x0, x1, x1, x0)
+        rectangles[2 * i + 1, :, 1] = (y0, y0, y1, y1)
+
+    for layer, indices in layer_to_indices.items():
+        c.add_polygon(rectangles[indices], layer=layer)
 
     port_width = height if port_orientation in {0, 180} else width
 
-    if port_orientation not in [0, 90, 270, 180]:
-        raise ValueError(
-            f"Invalid port_orientation = {port_orientation} not in [0, 90, 180, 270]"
-        )
     c.add_port(
         name="e1",
         width=port_width,
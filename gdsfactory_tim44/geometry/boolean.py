@@ -1,9 +1,11 @@
 """Based on phidl.geometry."""
 from __future__ import annotations
 
+from itertools import chain
 from typing import Tuple, Union
 
 import gdstk
+import numpy as np
 
 import gdsfactory as gf
 from gdsfactory.component import Component
@@ -12,6 +14,84 @@ from gdsfactory.component_reference import ComponentReference
 from gdsfactory.typings import ComponentOrReference, Int2, LayerSpec
 
 
+# operation alias: (gdstk operation, swap operands)
+_operations = {
+    "not": ("not", False),
+    "and": ("and", False),
+    "or": ("or", False),
+    "xor": ("xor", False),
+    "a-b": ("not", False),
+    "b-a": ("not", True),
+    "a+b": ("or", False),
+}
+
+
+def _get_polygons(elements) -> list:
+    """Returns the polygon points of all elements as a flat list.
+
+    A list rather than a generator: the trivial cases check emptiness first and
+    the list only holds references to the point arrays, not copies.
+    """
+    return list(
+        chain.from_iterable(
+            e.get_polygons(by_spec=False)
+            if isinstance(e, (Component, ComponentReference))
+            else e.polygons
+            for e in elements
+            if isinstance(e, (Component, ComponentReference, Polygon))
+        )
+    )
+
+
+def _boolean_tiles(
+    A_polys: list,
+    B_polys: list,
+    operation: str,
+    precision: float,
+    num_divisions: Int2,
+    layer: int,
+    datatype: int,
+) -> list:
+    """Returns the boolean of A and B computed over a grid of tiles.
+
+    Both operands are clipped to each tile of their common bounding box and the
+    per tile results are concatenated. Polygons crossing a tile edge are split.
+    """
+    polys = A_polys + B_polys
+    # per polygon bounding boxes as rows of (xmin, ymin, xmax, ymax)
+    bboxes = np.array([(*p.min(axis=0), *p.max(axis=0)) for p in polys])
+    xmin, ymin = bboxes[:, :2].min(axis=0)
+    xmax, ymax = bboxes[:, 2:].max(axis=0)
+    xs = np.linspace(xmin, xmax, num_divisions[0] + 1)
+    ys = np.linspace(ymin, ymax, num_divisions[1] + 1)
+    is_a = np.arange(len(polys)) < len(A_polys)
+
+    polygons = []
+    for x0, x1 in zip(xs[:-1], xs[1:]):
+        for y0, y1 in zip(ys[:-1], ys[1:]):
+            # only clip the polygons whose bounding box touches the tile
+            touches = (
+                (bboxes[:, 0] <= x1)
+                & (bboxes[:, 2] >= x0)
+                & (bboxes[:, 1] <= y1)
+                & (bboxes[:, 3] >= y0)
+            )
+            if not touches.any():
+                continue
+            tile = gdstk.rectangle((x0, y0), (x1, y1))
+            A_tile = [polys[i] for i in np.flatnonzero(touches & is_a)]
+            B_tile = [polys[i] for i in np.flatnonzero(touches & ~is_a)]
+            polygons += gdstk.boolean(
+                operand1=gdstk.boolean(A_tile, tile, "and", precision=precision),
+                operand2=gdstk.boolean(B_tile, tile, "and", precision=precision),
+                operation=operation,
+                precision=precision,
+                layer=layer,
+                datatype=datatype,
+            )
+    return polygons
+
+
 @gf.cell
 def boolean(
     A: Union[ComponentOrReference, Tuple[ComponentOrReference, ...]],
@@ -50,70 +130,72 @@ def boolean(
 
     """
     D = Component()
-    A_polys = []
-    B_polys = []
     A = list(A) if isinstance(A, (list, tuple)) else [A]
     B = list(B) if isinstance(B, (list, tuple)) else [B]
-
-    for X, polys in ((A, A_polys), (B, B_polys)):
-        for e in X:
-            if isinstance(e, (Component, ComponentReference)):
-                polys.extend(e.get_polygons())
-            elif isinstance(e, Polygon):
-                polys.extend(e.polygons)
+    A_polys = _get_polygons(A)
+    B_polys = _get_polygons(B)
 
     layer = gf.pdk.get_layer(layer)
     gds_layer, gds_datatype = _parse_layer(layer)
 
+    if isinstance(num_divisions, int):
+        num_divisions = (num_divisions, num_divisions)
+    num_divisions = tuple(num_divisions)
+
     operation = operation.lower().replace(" ", "")
-    if operation == "a-b":
-        operation = "not"
-    elif operation == "b-a":
-        operation = "not"
-        A_polys, B_polys = B_polys, A_polys
-    elif operation == "a+b":
-        operation = "or"
-    elif operation not in ["not", "and", "or", "xor", "a-b", "b-a", "a+b"]:
+    if operation not in _operations:
         raise ValueError(
             "gdsfactory.geometry.boolean() `operation` "
             "parameter not recognized, must be one of the "
             "following:  'not', 'and', 'or', 'xor', 'A-B', "
             "'B-A', 'A+B'"
         )
+    operation, swap = _operations[operation]
+    if swap:
+        A_polys, B_polys = B_polys, A_polys
 
     # Check for trivial solutions
-    if (not A_polys or not B_polys) and operation != "or":
-        if (
-            operation != "not"
-            and operation != "and"
-            and operation == "xor"
-            and not A_polys
-            and not B_polys
-            or operation != "not"
-            and operation == "and"
-        ):
-            p = None
-        elif operation != "not" and operation == "xor" and not A_polys:
-            p = B_polys
-        elif operation != "not" and operation == "xor":
-            p = A_polys
-        elif operation == "not":
-            p = A_polys or None
-    elif not A_polys and not B_polys:
-        p = None
+    if not A_polys and not B_polys:
+        polygons = []
+    elif operation != "or" and (not A_polys or not B_polys):
+        p = {"and": [], "not": A_polys, "xor": A_polys or B_polys}[operation]
+        polygons = [
+            gdstk.Polygon(points, layer=gds_layer, datatype=gds_datatype)
+            for points in p
+        ]
     else:
-        p = gdstk.boolean(
-            operand1=A_polys,
-            operand2=B_polys,
-            operation=operation,
-            precision=precision,
-            layer=gds_layer,
-            datatype=gds_datatype,
+        if num_divisions != (1, 1):
+            polygons = _boolean_tiles(
+                A_polys,
+                B_polys,
+                operation=operation,
+                precision=precision,
+                num_divisions=num_divisions,
+                layer=gds_layer,
+                datatype=gds_datatype,
+            )
+        else:
+            # clipper already drops duplicate and collinear vertices from the output
+            polygons = gdstk.boolean(
+                operand1=A_polys,
+                operand2=B_polys,
+                operation=operation,
+                precision=precision,
+                layer=gds_layer,
+                datatype=gds_datatype,
+            )
+
+    # fracture() returns the pieces, polygons within its 199 point limit stay whole
+    polygons = list(
+        chain.from_iterable(
+            polygon.fracture(precision=precision)
+            if len(polygon.points) > 199
+            else (polygon,)
+            for polygon in polygons
         )
-
-    if p is not None:
-        polygons = D.add_polygon(p, layer=layer)
-        [polygon.fracture(precision=precision) for polygon in polygons]
+    )
+    # gdstk already sets the layer, so add the polygons as they are
+    D.add(polygons)
     return D
 
 
@@ -128,6 +210,14 @@ def test_boolean() -> None:
     assert len(c.polygons) == 2, len(c.polygons)
 
 
+def test_boolean_num_divisions() -> None:
+    c1 = gf.components.circle(radius=10)
+    c2 = gf.components.circle(radius=9)
+    xor = boolean(c1, c2, operation="xor")
+    xor_tiles = boolean(c1, c2, operation="xor", num_divisions=(3, 2))
+    assert abs(xor.area() - xor_tiles.area()) < 1e-3, xor_tiles.area()
+
+
 if __name__ == "__main__":
     # c = gf.Component()
     # e1 = c << gf.components.ellipse()
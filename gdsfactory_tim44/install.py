@@ -1,13 +1,15 @@
 """Install Klayout and GIT plugins."""
 from __future__ import annotations
 
-import configparser
 import os
 import pathlib
 import shutil
 import sys
+import tempfile
 from typing import Optional
 
+_klayout_folder = "KLayout" if sys.platform == "win32" else ".klayout"
+
 
 def remove_path_or_dir(dest: pathlib.Path):
     if dest.is_dir():
@@ -16,6 +18,28 @@ def remove_path_or_dir(dest: pathlib.Path):
         os.remove(dest)
 
 
+_symlinks_supported: Optional[bool] = None
+
+
+def _can_symlink() -> bool:
+    """Returns True if symlinks can be created (Windows needs extra privileges).
+
+    The probe runs once per process, its result is remembered either way.
+    """
+    global _symlinks_supported
+    if sys.platform != "win32":
+        return True
+    if _symlinks_supported is None:
+        with tempfile.TemporaryDirectory() as dirpath:
+            dirpath = pathlib.Path(dirpath)
+            try:
+                os.symlink(dirpath, dirpath / "link", target_is_directory=True)
+                _symlinks_supported = True
+            except OSError:
+                _symlinks_supported = False
+    return _symlinks_supported
+
+
 def make_link(src, dest, overwrite: bool = True) -> None:
     dest = pathlib.Path(dest)
     if dest.exists() and not overwrite:
@@ -24,13 +48,18 @@ def make_link(src, dest, overwrite: bool = True) -> None:
     if dest.exists() or dest.is_symlink():
         print(f"removing {dest} already installed")
         remove_path_or_dir(dest)
+    if not _can_symlink():
+        # https://stackoverflow.com/questions/32877260/privlege-error-trying-to-create-symlink-using-python-on-windows-10
+        shutil.copy(src, dest)
+        print(f"Could not create symlink, copied {src} to {dest}")
+        return
     try:
         os.symlink(src, dest, target_is_directory=True)
     except OSError as err:
         print("Could not create symlink!")
         print("     Error: ", err)
         if sys.platform == "win32":
-            # https://stackoverflow.com/questions/32877260/privlege-error-trying-to-create-symlink-using-python-on-windows-10
+            # the probe can pass while this link fails (other volume, permissions)
             shutil.copy(src, dest)
     print("Symlink made:")
     print(f"From: {src}")
@@ -67,24 +96,23 @@ def write_git_config(git_config_path):
     print("git diff FILE.GDS")
     print("Appending the gdsdiff command to your ~/.gitconfig")
 
-    config = configparser.RawConfigParser()
-    config.read(git_config_path)
-    key = 'diff "gds_diff"'
-
-    if key not in config.sections():
-        config.add_section(key)
-        config.set(key, "command", "python -m gdsfactory.gdsdiff.gds_diff_git")
-        config.set(key, "binary", "True")
+    git_config_path = pathlib.Path(git_config_path)
+    key = '[diff "gds_diff"]'
+    if git_config_path.exists() and key in git_config_path.read_text():
+        return
 
-        with open(git_config_path, "w+") as f:
-            config.write(f, space_around_delimiters=True)
+    # append instead of rewriting the user's whole config through configparser
+    with open(git_config_path, "a") as f:
+        f.write(
+            f"\n{key}\n"
+            "\tcommand = python -m gdsfactory.gdsdiff.gds_diff_git\n"
+            "\tbinary = True\n"
+        )
 
 
 def get_klayout_path() -> pathlib.Path:
     """Returns KLayout path."""
-    klayout_folder = "KLayout" if sys.platform == "win32" else ".klayout"
-    home = pathlib.Path.home()
-    return home / klayout_folder
+    return pathlib.Path.home() / _klayout_folder
 
 
 def copy(src: pathlib.Path, dest: pathlib.Path) -> None:
@@ -111,8 +139,7 @@ def _install_to_klayout(
     Equivalent to using KLayout package manager.
 
     """
-    klayout_folder = "KLayout" if sys.platform == "win32" else ".klayout"
-    subdir = pathlib.Path.home() / klayout_folder / klayout_subdir_name
+    subdir = get_klayout_path() / klayout_subdir_name
     dest = subdir / package_name
     subdir.mkdir(exist_ok=True, parents=True)
     make_link(src, dest)
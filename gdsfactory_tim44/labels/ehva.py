@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
 import flatdict
@@ -7,6 +8,7 @@ import pydantic
 
 import gdsfactory as gf
 from gdsfactory.name import clean_name
+from gdsfactory.port import sort_ports_clockwise
 from gdsfactory.snap import snap_to_grid as snap
 from gdsfactory.typings import Layer
 
@@ -39,6 +41,11 @@ prefix_to_type_default = {
 }
 
 
+@lru_cache(maxsize=None)
+def _longest_prefixes_first(prefixes: Tuple[str, ...]) -> Tuple[str, ...]:
+    return tuple(sorted(prefixes, key=len, reverse=True))
+
+
 @pydantic.validate_arguments
 def add_label_ehva(
     component: gf.Component,
@@ -66,46 +73,58 @@ def add_label_ehva(
     metadata_include_parent = metadata_include_parent or []
     metadata_include_child = metadata_include_child or []
 
-    text = f"""DIE NAME:{die}
-CIRCUIT NAME:{component.name}
-"""
-    info = []
+    circuit_info = []
 
     metadata = component.metadata_child["changed"]
     if metadata:
-        info += [
+        circuit_info += [
             f"CIRCUITINFO NAME: {k}, VALUE: {v}"
             for k, v in metadata.items()
             if k not in metadata_ignore and isinstance(v, (int, float, str))
         ]
 
-    metadata = flatdict.FlatDict(component.metadata["full"])
-    info += [
-        f"CIRCUITINFO NAME: {clean_name(k)}, VALUE: {metadata.get(k)}"
-        for k in metadata_include_parent
-        if metadata.get(k)
-    ]
-
-    metadata = flatdict.FlatDict(component.metadata_child["full"])
-    info += [
-        f"CIRCUITINFO NAME: {k}, VALUE: {metadata.get(k)}"
-        for k in metadata_include_child
-        if metadata.get(k)
-    ]
+    if metadata_include_parent:
+        metadata = flatdict.FlatDict(component.metadata["full"])
+        circuit_info += [
+            f"CIRCUITINFO NAME: {clean_name(k)}, VALUE: {metadata.get(k)}"
+            for k in metadata_include_parent
+            if metadata.get(k)
+        ]
 
-    text += "\n".join(info)
-    text += "\n"
+    if metadata_include_child:
+        metadata = flatdict.FlatDict(component.metadata_child["full"])
+        circuit_info += [
+            f"CIRCUITINFO NAME: {k}, VALUE: {metadata.get(k)}"
+            for k in metadata_include_child
+            if metadata.get(k)
+        ]
 
-    info = []
+    port_info = []
     if component.ports:
+        # one pass over the ports, each port goes to its longest matching prefix
+        prefixes = _longest_prefixes_first(tuple(prefix_to_type))
+        ports_by_prefix = {prefix: [] for prefix in prefix_to_type}
+        for port_name, port in sort_ports_clockwise(component.ports).items():
+            for prefix in prefixes:
+                if str(port_name).startswith(prefix):
+                    ports_by_prefix[prefix].append(port)
+                    break
+
         for prefix, port_type_ehva in prefix_to_type.items():
-            info += [
+            port_info += [
                 f"{port_type_ehva} NAME: {port.name} TYPE: {port_type_ehva}, "
                 f"POSITION RELATIVE:({snap(port.x)}, {snap(port.y)}),"
                 f" ORIENTATION: {port.orientation}"
-                for port in component.get_ports_list(prefix=prefix)
+                for port in ports_by_prefix[prefix]
             ]
-    text += "\n".join(info)
+    # an empty section still leaves an empty line
+    lines = [
+        f"DIE NAME:{die}",
+        f"CIRCUIT NAME:{component.name}",
+        *(circuit_info or [""]),
+        *(port_info or [""]),
+    ]
+    text = "\n".join(lines)
 
     label = gf.Label(
         text=text,
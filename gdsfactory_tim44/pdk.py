@@ -4,7 +4,7 @@ from __future__ import annotations
 import pathlib
 import warnings
 from functools import partial
-from typing import Any, Callable, Optional, Union, Tuple
+from typing import Any, Callable, Mapping, Optional, Union, Tuple
 from typing_extensions import Literal
 
 import numpy as np
@@ -630,7 +630,7 @@ def _set_active_pdk(pdk: Pdk) -> None:
     on_pdk_activated.fire(old_pdk=old_pdk, new_pdk=pdk)
 
 
-def get_routing_strategies() -> Dict[str, Callable]:
+def get_routing_strategies() -> Mapping[str, Callable]:
     """Gets a dictionary of named routing functions available to the PDK, if defined, or gdsfactory defaults otherwise."""
     from gdsfactory.routing.factories import (
         routing_strategy as default_routing_strategies,
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from types import MappingProxyType
+
 from gdsfactory.routing.get_bundle import (
     get_bundle,
     get_bundle_electrical,
@@ -14,7 +16,7 @@ from gdsfactory.routing.get_bundle_path_length_match import get_bundle_path_leng
 
 from gdsfactory.routing.all_angle import get_bundle_all_angle
 
-routing_strategy = dict(
+_routing_strategy = dict(
     get_bundle=get_bundle,
     get_bundle_electrical=get_bundle_electrical,
     get_bundle_path_length_match=get_bundle_path_length_match,
@@ -24,3 +26,5 @@ routing_strategy = dict(
     get_bundle_from_steps_electrical=get_bundle_from_steps_electrical,
     get_bundle_all_angle=get_bundle_all_angle,
 )
+
+routing_strategy = MappingProxyType(_routing_strategy)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from operator import attrgetter
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import numpy as np
@@ -11,18 +12,14 @@ from gdsfactory.routing.get_route import get_route
 from gdsfactory.typings import Route
 
 
-def sort_key_west_to_east(port: Port) -> float:
-    return port.x
+sort_key_west_to_east = attrgetter("x")
+sort_key_south_to_north = attrgetter("y")
 
 
 def sort_key_east_to_west(port: Port) -> float:
     return -port.x
 
 
-def sort_key_south_to_north(port: Port) -> float:
-    return port.y
-
-
 def sort_key_north_to_south(port: Port) -> float:
     return -port.y
 
@@ -169,66 +166,67 @@ def route_ports_to_x(
     4. north ports
 
     """
-    north_ports = [p for p in list_ports if p.orientation == 90]
-    south_ports = [p for p in list_ports if p.orientation == 270]
-    east_ports = [p for p in list_ports if p.orientation == 0]
-    west_ports = [p for p in list_ports if p.orientation == 180]
+    xs = np.array([p.x for p in list_ports])
+    ys = np.array([p.y for p in list_ports])
+    orientations = np.array([p.orientation for p in list_ports], dtype=float)
+    min_x, max_x = xs.min(), xs.max()
+    min_y, max_y = ys.min(), ys.max()
+
+    ports_by_orientation = {0: [], 90: [], 180: [], 270: []}
+    for port, orientation in zip(list_ports, orientations.tolist()):
+        if orientation in ports_by_orientation:
+            ports_by_orientation[orientation].append(port)
+    east_ports, north_ports, west_ports, south_ports = ports_by_orientation.values()
 
     epsilon = 1.0
     a = epsilon + max(radius, separation)
     bx = epsilon + max(radius, dx_start) if dx_start else a
     by = epsilon + max(radius, dy_start) if dy_start else a
 
-    xs = [p.x for p in list_ports]
-    ys = [p.y for p in list_ports]
-
     if y0_bottom is None:
-        y0_bottom = min(ys) - by
+        y0_bottom = min_y - by
 
     y0_bottom -= extend_bottom
 
     if y0_top is None:
-        y0_top = max(ys) + (max(radius, dy_start) if dy_start else a)
+        y0_top = max_y + (max(radius, dy_start) if dy_start else a)
     y0_top += extend_top
 
     if x == "west" and extension_length > 0:
         extension_length = -extension_length
 
     if x == "east":
-        x = max(p.x for p in list_ports) + bx
+        x = max_x + bx
     elif x == "west":
-        x = min(p.x for p in list_ports) - bx
+        x = min_x - bx
     elif isinstance(x, (float, int)):
         pass
     else:
         raise ValueError(f"x={x!r} should be a float or east or west")
 
-    if x < min(xs):
-        sort_key_north = sort_key_west_to_east
-        sort_key_south = sort_key_west_to_east
+    if x < min_x:
+        east_to_west = False
         forward_ports = west_ports
         backward_ports = east_ports
         angle = 0
 
-    elif x > max(xs):
-        sort_key_south = sort_key_east_to_west
-        sort_key_north = sort_key_east_to_west
+    elif x > max_x:
+        east_to_west = True
         forward_ports = east_ports
         backward_ports = west_ports
         angle = 180
     else:
         raise ValueError("x should be either to the east or to the west of all ports")
 
-    # forward_ports.sort()
-    north_ports.sort(key=sort_key_north)
-    south_ports.sort(key=sort_key_south)
+    north_ports.sort(key=sort_key_west_to_east, reverse=east_to_west)
+    south_ports.sort(key=sort_key_west_to_east, reverse=east_to_west)
     forward_ports.sort(key=sort_key_south_to_north)
 
+    # the south half is already sorted south to north, the north half is reversed
     backward_ports.sort(key=sort_key_south_to_north)
     backward_ports_thru_south = backward_ports[:backward_port_side_split_index]
     backward_ports_thru_north = backward_ports[backward_port_side_split_index:]
-    backward_ports_thru_south.sort(key=sort_key_south_to_north)
-    backward_ports_thru_north.sort(key=sort_key_north_to_south)
+    backward_ports_thru_north.sort(key=sort_key_south_to_north, reverse=True)
 
     routes = []
     ports = []
@@ -263,48 +261,25 @@ def route_ports_to_x(
         add_port(p, y_optical_top, routes, ports)
         y_optical_top += separation
 
-    start_straight_length_section = start_straight_length
-    max_x = max(xs)
-    min_x = min(xs)
-
-    for p in backward_ports_thru_north:
-        # Extend ports if necessary
-        if angle == 0 and p.x < max_x:
-            start_straight_length_section = max_x - p.x
-        elif angle == 180 and p.x > min_x:
-            start_straight_length_section = p.x - min_x
-        else:
-            start_straight_length_section = 0
-
-        add_port(
-            p,
-            y_optical_top,
-            routes,
-            ports,
-            start_straight_length=start_straight_length + start_straight_length_section,
-        )
+    # backward ports are extended to clear the other ports, north ones first
+    backward_ports = backward_ports_thru_north + backward_ports_thru_south
+    backward_xs = np.array([p.x for p in backward_ports], dtype=float)
+    if angle == 0:
+        extensions = np.maximum(max_x - backward_xs, 0)
+    else:
+        extensions = np.maximum(backward_xs - min_x, 0)
+    start_straight_lengths = (
+        start_straight_length + separation * np.arange(len(backward_ports)) + extensions
+    ).tolist()
+    n_north = len(backward_ports_thru_north)
+
+    for p, length in zip(backward_ports_thru_north, start_straight_lengths[:n_north]):
+        add_port(p, y_optical_top, routes, ports, start_straight_length=length)
         y_optical_top += separation
-        start_straight_length += separation
-
-    start_straight_length_section = start_straight_length
-    for p in backward_ports_thru_south:
-        # Extend ports if necessary
-        if angle == 0 and p.x < max_x:
-            start_straight_length_section = max_x - p.x
-        elif angle == 180 and p.x > min_x:
-            start_straight_length_section = p.x - min_x
-        else:
-            start_straight_length_section = 0
 
-        add_port(
-            p,
-            y_optical_bot,
-            routes,
-            ports,
-            start_straight_length=start_straight_length + start_straight_length_section,
-        )
+    for p, length in zip(backward_ports_thru_south, start_straight_lengths[n_north:]):
+        add_port(p, y_optical_bot, routes, ports, start_straight_length=length)
         y_optical_bot -= separation
-        start_straight_length += separation
 
     return routes, ports
 
@@ -360,81 +335,66 @@ def route_ports_to_y(
     if y == "south" and extension_length > 0:
         extension_length = -extension_length
 
+    xs = np.array([p.x for p in list_ports])
+    ys = np.array([p.y for p in list_ports])
+    orientations = np.array([p.orientation for p in list_ports], dtype=float)
+    min_x, max_x = xs.min(), xs.max()
+    min_y, max_y = ys.min(), ys.max()
+
     da = 45
-    north_ports = [
-        p for p in list_ports if p.orientation > 90 - da and p.orientation < 90 + da
-    ]
-    south_ports = [
-        p for p in list_ports if p.orientation > 270 - da and p.orientation < 270 + da
-    ]
-    east_ports = [
-        p for p in list_ports if p.orientation < da or p.orientation > 360 - da
-    ]
-    west_ports = [
-        p for p in list_ports if p.orientation < 180 + da and p.orientation > 180 - da
-    ]
+    # 0: east, 1: north, 2: west, 3: south, ports exactly in between match none
+    sides = ((orientations + da) // 90) % 4
+    sides[orientations % 90 == da] = np.nan
+    ports_by_side = {0: [], 1: [], 2: [], 3: []}
+    for port, side in zip(list_ports, sides.tolist()):
+        if side in ports_by_side:
+            ports_by_side[side].append(port)
+    east_ports, north_ports, west_ports, south_ports = ports_by_side.values()
 
     epsilon = 1.0
     a = radius + max(radius, separation)
     bx = epsilon + max(radius, dx_start) if dx_start else a
     by = epsilon + max(radius, dy_start) if dy_start else a
 
-    xs = [p.x for p in list_ports]
-    ys = [p.y for p in list_ports]
-
     if x0_left is None:
-        x0_left = min(xs) - bx
+        x0_left = min_x - bx
     x0_left -= extend_left
 
     if x0_right is None:
-        x0_right = max(xs) + (max(radius, dx_start) if dx_start else a)
+        x0_right = max_x + (max(radius, dx_start) if dx_start else a)
     x0_right += extend_right
 
-    if y == "north":
-        y = (
-            max(
-                p.y + a * np.abs(np.cos(p.orientation * np.pi / 180))
-                for p in list_ports
-            )
-            + by
-        )
-    elif y == "south":
-        y = (
-            min(
-                p.y - a * np.abs(np.cos(p.orientation * np.pi / 180))
-                for p in list_ports
-            )
-            - by
-        )
+    if y in {"north", "south"}:
+        cos_abs = np.abs(np.cos(orientations * (np.pi / 180)))
+        if y == "north":
+            y = float((ys + a * cos_abs).max()) + by
+        else:
+            y = float((ys - a * cos_abs).min()) - by
     elif isinstance(y, (float, int)):
         pass
-    if y <= min(ys):
-        sort_key_east = sort_key_south_to_north
-        sort_key_west = sort_key_south_to_north
+    if y <= min_y:
+        north_to_south = False
         forward_ports = south_ports
         backward_ports = north_ports
         angle = 90.0
 
-    elif y >= max(ys):
-        sort_key_west = sort_key_north_to_south
-        sort_key_east = sort_key_north_to_south
+    elif y >= max_y:
+        north_to_south = True
         forward_ports = north_ports
         backward_ports = south_ports
         angle = -90.0
     else:
         raise ValueError("y should be either to the north or to the south of all ports")
 
-    west_ports.sort(key=sort_key_west)
-    east_ports.sort(key=sort_key_east)
+    west_ports.sort(key=sort_key_south_to_north, reverse=north_to_south)
+    east_ports.sort(key=sort_key_south_to_north, reverse=north_to_south)
     forward_ports.sort(key=sort_key_west_to_east)
-    backward_ports.sort(key=sort_key_east_to_west)
 
+    # the west half is already sorted west to east, the east half is reversed
     backward_ports.sort(key=sort_key_west_to_east)
     backward_ports_thru_west = backward_ports[:backward_port_side_split_index]
     backward_ports_thru_east = backward_ports[backward_port_side_split_index:]
-
-    backward_ports_thru_west.sort(key=sort_key_west_to_east)
-    backward_ports_thru_east.sort(key=sort_key_east_to_west)
+    backward_ports_thru_east.sort(key=sort_key_west_to_east, reverse=True)
 
     routes = []
     ports = []
@@ -480,29 +440,26 @@ def route_ports_to_y(
         add_port(p, x_optical_right, routes, ports)
         x_optical_right += separation
 
-    start_straight_length_section = start_straight_length
-    for p in backward_ports_thru_east:
+    # the i-th backward port on each side is offset by i * separation
+    offsets = (separation * np.arange(len(backward_ports))).tolist()
+
+    for p, offset in zip(backward_ports_thru_east, offsets):
         add_port(
             p,
-            x_optical_right,
+            x_optical_right + offset,
             routes,
             ports,
-            start_straight_length=start_straight_length_section,
+            start_straight_length=start_straight_length + offset,
         )
-        x_optical_right += separation
-        start_straight_length_section += separation
 
-    start_straight_length_section = start_straight_length
-    for p in backward_ports_thru_west:
+    for p, offset in zip(backward_ports_thru_west, offsets):
         add_port(
             p,
-            x_optical_left,
+            x_optical_left - offset,
             routes,
             ports,
-            start_straight_length=start_straight_length_section,
+            start_straight_length=start_straight_length + offset,
         )
-        x_optical_left -= separation
-        start_straight_length_section += separation
 
     return routes, ports
 
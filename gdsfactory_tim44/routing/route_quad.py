@@ -1,19 +1,41 @@
 """Route for electrical based on phidl.routing.route_quad."""
 from __future__ import annotations
 
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 
 import numpy as np
 
 import gdsfactory as gf
 from gdsfactory.port import Port
 
+_cardinal_directions = ((1.0, 0.0), (0.0, 1.0), (-1.0, 0.0), (0.0, -1.0))
 
+
+@lru_cache(maxsize=16)
+def _get_rotated_basis_tuples(
+    theta: float,
+) -> Tuple[Tuple[float, float], Tuple[float, float]]:
+    """Returns basis vectors rotated CCW by theta (in degrees) as (x, y) tuples."""
+    if theta % 90 == 0:
+        # exact cardinal vectors, trig leaves 6e-17 residues at multiples of 90
+        cos_theta, sin_theta = _cardinal_directions[int(theta % 360) // 90]
+    else:
+        theta = np.radians(theta)
+        cos_theta, sin_theta = float(np.cos(theta)), float(np.sin(theta))
+    return (cos_theta, sin_theta), (-1 * sin_theta, cos_theta)
+
+
+@lru_cache(maxsize=16)
 def _get_rotated_basis(theta):
-    """Returns basis vectors rotated CCW by theta (in degrees)."""
-    theta = np.radians(theta)
-    e1 = np.array([np.cos(theta), np.sin(theta)])
-    e2 = np.array([-1 * np.sin(theta), np.cos(theta)])
+    """Returns basis vectors rotated CCW by theta (in degrees).
+
+    Cached as orientations are nearly always multiples of 90, so the arrays are
+    shared and read-only.
+    """
+    e1, e2 = map(np.array, _get_rotated_basis_tuples(theta))
+    e1.flags.writeable = False
+    e2.flags.writeable = False
     return e1, e2
 
 
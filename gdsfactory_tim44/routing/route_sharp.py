@@ -1,6 +1,7 @@
 """based on phidl.routing."""
 from __future__ import annotations
 
+from collections.abc import Sized
 from typing import Optional, Tuple
 
 import numpy as np
@@ -10,10 +11,77 @@ from gdsfactory.component import Component
 from gdsfactory.cross_section import CrossSection
 from gdsfactory.path import Path, transition
 from gdsfactory.port import Port
-from gdsfactory.routing.route_quad import _get_rotated_basis
+from gdsfactory.routing.route_quad import _get_rotated_basis_tuples
 from gdsfactory.typings import CrossSectionSpec, LayerSpec
 
 
+def _dot2(a, b) -> float:
+    """Returns the dot product of two 2D vectors without numpy dispatch."""
+    return a[0] * b[0] + a[1] * b[1]
+
+
+def _delta_orientation(port1: Port, port2: Port) -> float:
+    """Returns the orientation of port1 relative to port2 in [0, 360]."""
+    return round(abs((port1.orientation - port2.orientation) % 360), 3)
+
+
+# The _waypoints_* builders assemble waypoints from the port centers and the
+# precomputed basis vectors. e1 and e_left are the forward and left directions
+# of port1, e2 is the forward direction of port2. The math is done on scalars
+# so each route allocates a single waypoint array.
+
+
+def _waypoints_L(pt1, pt3, e1) -> np.ndarray:
+    (x1, y1), (x3, y3), (e1x, e1y) = pt1, pt3, e1
+    forward = (x3 - x1) * e1x + (y3 - y1) * e1y
+    return np.array([(x1, y1), (x1 + forward * e1x, y1 + forward * e1y), (x3, y3)])
+
+
+def _waypoints_U(pt1, pt4, e1, e_left, length1) -> np.ndarray:
+    (x1, y1), (x4, y4), (e1x, e1y), (elx, ely) = pt1, pt4, e1, e_left
+    # outward by length1 distance
+    x2 = x1 + length1 * e1x
+    y2 = y1 + length1 * e1y
+    left = (x4 - x2) * elx + (y4 - y2) * ely
+    x3 = x2 + left * elx
+    y3 = y2 + left * ely
+    return np.array([(x1, y1), (x2, y2), (x3, y3), (x4, y4)])
+
+
+def _waypoints_J(pt1, pt5, e1, e2, length1, length2) -> np.ndarray:
+    (x1, y1), (x5, y5), (e1x, e1y), (e2x, e2y) = pt1, pt5, e1, e2
+    # outward from port1 by length1
+    x2 = x1 + length1 * e1x
+    y2 = y1 + length1 * e1y
+    # outward from port2 by length2
+    x4 = x5 + length2 * e2x
+    y4 = y5 + length2 * e2y
+    # move orthogonally in e2 direction
+    along = (x4 - x2) * e2x + (y4 - y2) * e2y
+    x3 = x2 + along * e2x
+    y3 = y2 + along * e2y
+    return np.array([(x1, y1), (x2, y2), (x3, y3), (x4, y4), (x5, y5)])
+
+
+def _waypoints_C(pt1, pt6, e1, e_left, e2, length1, left1, length2) -> np.ndarray:
+    (x1, y1), (x6, y6) = pt1, pt6
+    (e1x, e1y), (elx, ely), (e2x, e2y) = e1, e_left, e2
+    # outward from port1 by length1
+    x2 = x1 + length1 * e1x
+    y2 = y1 + length1 * e1y
+    # leftward by left1
+    x3 = x2 + left1 * elx
+    y3 = y2 + left1 * ely
+    # outward from port2 by length2
+    x5 = x6 + length2 * e2x
+    y5 = y6 + length2 * e2y
+    # move orthogonally in e1 direction
+    along = (x5 - x3) * e1x + (y5 - y3) * e1y
+    x4 = x3 + along * e1x
+    y4 = y3 + along * e1y
+    return np.array([(x1, y1), (x2, y2), (x3, y3), (x4, y4), (x5, y5), (x6, y6)])
+
+
 def path_straight(port1: Port, port2: Port) -> Path:
     """Return waypoint path between port1 and port2 in a straight line.
 
@@ -24,17 +92,13 @@ def path_straight(port1: Port, port2: Port) -> Path:
         port2: end port.
 
     """
-    delta_orientation = np.round(
-        np.abs(np.mod(port1.orientation - port2.orientation, 360)), 3
-    )
-    e1, e2 = _get_rotated_basis(port1.orientation)
+    delta_orientation = _delta_orientation(port1, port2)
+    e1, e2 = _get_rotated_basis_tuples(port1.orientation)
     displacement = port2.center - port1.center
-    xrel = np.round(
-        np.dot(displacement, e1), 3
+    xrel = round(
+        _dot2(displacement, e1), 3
     )  # relative position of port 2, forward/backward
-    yrel = np.round(
-        np.dot(displacement, e2), 3
-    )  # relative position of port 2, left/right
+    yrel = round(_dot2(displacement, e2), 3)  # relative position of port 2, left/right
     if (delta_orientation not in (0, 180, 360)) or (yrel != 0) or (xrel <= 0):
         raise ValueError("path_straight(): ports must point directly at each other.")
     return Path(np.array([port1.center, port2.center]))
@@ -50,18 +114,11 @@ def path_L(port1: Port, port2: Port) -> Path:
         port2: end port.
 
     """
-    delta_orientation = np.round(
-        np.abs(np.mod(port1.orientation - port2.orientation, 360)), 3
-    )
+    delta_orientation = _delta_orientation(port1, port2)
     if delta_orientation not in (90, 270):
         raise ValueError("path_L(): ports must be orthogonal.")
-    e1, e2 = _get_rotated_basis(port1.orientation)
-    # assemble waypoints
-    pt1 = port1.center
-    pt3 = port2.center
-    delta_vec = pt3 - pt1
-    pt2 = pt1 + np.dot(delta_vec, e1) * e1
-    return Path(np.array([pt1, pt2, pt3]))
+    e1, _ = _get_rotated_basis_tuples(port1.orientation)
+    return Path(_waypoints_L(port1.center, port2.center, e1))
 
 
 def path_U(port1: Port, port2: Port, length1=200) -> Path:
@@ -74,21 +131,11 @@ def path_U(port1: Port, port2: Port, length1=200) -> Path:
             Should be larger than bend radius.
 
     """
-    delta_orientation = np.round(
-        np.abs(np.mod(port1.orientation - port2.orientation, 360)), 3
-    )
+    delta_orientation = _delta_orientation(port1, port2)
     if delta_orientation not in (0, 180, 360):
         raise ValueError("path_U(): ports must be parallel.")
-    theta = np.radians(port1.orientation)
-    e1 = np.array([np.cos(theta), np.sin(theta)])
-    e2 = np.array([-1 * np.sin(theta), np.cos(theta)])
-    # assemble waypoints
-    pt1 = port1.center
-    pt4 = port2.center
-    pt2 = pt1 + length1 * e1  # outward by length1 distance
-    delta_vec = pt4 - pt2
-    pt3 = pt2 + np.dot(delta_vec, e2) * e2
-    return Path(np.array([pt1, pt2, pt3, pt4]))
+    e1, e_left = _get_rotated_basis_tuples(port1.orientation)
+    return Path(_waypoints_U(port1.center, port2.center, e1, e_left, length1))
 
 
 def path_J(port1: Port, port2: Port, length1=200, length2=200) -> Path:
@@ -104,21 +151,12 @@ def path_J(port1: Port, port2: Port, length1=200, length2=200) -> Path:
             Should be larger than bend radius.
 
     """
-    delta_orientation = np.round(
-        np.abs(np.mod(port1.orientation - port2.orientation, 360)), 3
-    )
+    delta_orientation = _delta_orientation(port1, port2)
     if delta_orientation not in (90, 270):
         raise ValueError("path_J(): ports must be orthogonal.")
-    e1, _ = _get_rotated_basis(port1.orientation)
-    e2, _ = _get_rotated_basis(port2.orientation)
-    # assemble waypoints
-    pt1 = port1.center
-    pt2 = pt1 + length1 * e1  # outward from port1 by length1
-    pt5 = port2.center
-    pt4 = pt5 + length2 * e2  # outward from port2 by length2
-    delta_vec = pt4 - pt2
-    pt3 = pt2 + np.dot(delta_vec, e2) * e2  # move orthogonally in e2 direction
-    return Path(np.array([pt1, pt2, pt3, pt4, pt5]))
+    e1, _ = _get_rotated_basis_tuples(port1.orientation)
+    e2, _ = _get_rotated_basis_tuples(port2.orientation)
+    return Path(_waypoints_J(port1.center, port2.center, e1, e2, length1, length2))
 
 
 def path_C(port1: Port, port2: Port, length1=100, left1=100, length2=100) -> Path:
@@ -135,22 +173,16 @@ def path_C(port1: Port, port2: Port, length1=100, left1=100, length2=100) -> Pat
             than bend radius.
 
     """
-    delta_orientation = np.round(
-        np.abs(np.mod(port1.orientation - port2.orientation, 360)), 3
-    )
+    delta_orientation = _delta_orientation(port1, port2)
     if delta_orientation not in (0, 180, 360):
         raise ValueError("path_C(): ports must be parallel.")
-    e1, e_left = _get_rotated_basis(port1.orientation)
-    e2, _ = _get_rotated_basis(port2.orientation)
-    # assemble route points
-    pt1 = port1.center
-    pt2 = pt1 + length1 * e1  # outward from port1 by length1
-    pt3 = pt2 + left1 * e_left  # leftward by left1
-    pt6 = port2.center
-    pt5 = pt6 + length2 * e2  # outward from port2 by length2
-    delta_vec = pt5 - pt3
-    pt4 = pt3 + np.dot(delta_vec, e1) * e1  # move orthogonally in e1 direction
-    return Path(np.array([pt1, pt2, pt3, pt4, pt5, pt6]))
+    e1, e_left = _get_rotated_basis_tuples(port1.orientation)
+    e2, _ = _get_rotated_basis_tuples(port2.orientation)
+    return Path(
+        _waypoints_C(
+            port1.center, port2.center, e1, e_left, e2, length1, left1, length2
+        )
+    )
 
 
 def path_manhattan(port1: Port, port2: Port, radius) -> Path:
@@ -163,16 +195,18 @@ def path_manhattan(port1: Port, port2: Port, radius) -> Path:
 
     """
     radius = radius + 0.1  # ensure space for bend radius
-    e1, e2 = _get_rotated_basis(port1.orientation)
-    displacement = port2.center - port1.center
-    xrel = np.round(
-        np.dot(displacement, e1), 3
+    e1, e_left = _get_rotated_basis_tuples(port1.orientation)
+    pt1 = port1.center
+    pt2 = port2.center
+    displacement = pt2 - pt1
+    xrel = round(
+        _dot2(displacement, e1), 3
     )  # port2 position, forward(+)/backward(-) from port 1
-    yrel = np.round(
-        np.dot(displacement, e2), 3
+    yrel = round(
+        _dot2(displacement, e_left), 3
     )  # port2 position, left(+)/right(-) from port1
-    orel = np.round(
-        np.abs(np.mod(port2.orientation - port1.orientation, 360)), 3
+    orel = round(
+        abs((port2.orientation - port1.orientation) % 360), 3
     )  # relative orientation
     if orel not in (0, 90, 180, 270, 360):
         raise ValueError(
@@ -183,41 +217,41 @@ def path_manhattan(port1: Port, port2: Port, radius) -> Path:
         if (
             (orel == 90 and yrel < -1 * radius) or (orel == 270 and yrel > radius)
         ) and xrel > radius:
-            pts = path_L(port1, port2)
+            waypoints = _waypoints_L(pt1, pt2, e1)
         else:
             # Adjust length1 and length2 to ensure intermediate segments fit bend radius
             direction = -1 if (orel == 270) else 1
             length2 = (
                 2 * radius - direction * yrel
-                if (np.abs(radius + direction * yrel) < 2 * radius)
+                if (abs(radius + direction * yrel) < 2 * radius)
                 else radius
             )
-            length1 = (
-                2 * radius + xrel if (np.abs(radius - xrel) < 2 * radius) else radius
-            )
-            pts = path_J(port1, port2, length1=length1, length2=length2)
+            length1 = 2 * radius + xrel if (abs(radius - xrel) < 2 * radius) else radius
+            e2, _ = _get_rotated_basis_tuples(port2.orientation)
+            waypoints = _waypoints_J(pt1, pt2, e1, e2, length1, length2)
     elif orel == 180 and yrel == 0 and xrel > 0:
-        pts = path_straight(port1, port2)
-    elif (orel == 180 and xrel <= 2 * radius) or (np.abs(yrel) < 2 * radius):
+        waypoints = np.array([pt1, pt2])
+    elif (orel == 180 and xrel <= 2 * radius) or (abs(yrel) < 2 * radius):
         # Adjust length1 and left1 to ensure intermediate segments fit bend radius
-        left1 = np.abs(yrel) + 2 * radius if (np.abs(yrel) < 4 * radius) else 2 * radius
+        left1 = abs(yrel) + 2 * radius if (abs(yrel) < 4 * radius) else 2 * radius
         y_direction = -1 if (yrel < 0) else 1
         left1 = y_direction * left1
         length2 = radius
         x_direction = -1 if (orel == 180) else 1
-        segmentx_length = np.abs(xrel + x_direction * length2 - radius)
+        segmentx_length = abs(xrel + x_direction * length2 - radius)
         length1 = (
             xrel + x_direction * length2 + 2 * radius
             if segmentx_length < 2 * radius
             else radius
         )
 
-        pts = path_C(port1, port2, length1=length1, length2=length2, left1=left1)
+        e2, _ = _get_rotated_basis_tuples(port2.orientation)
+        waypoints = _waypoints_C(pt1, pt2, e1, e_left, e2, length1, left1, length2)
     else:
         # Adjust length1 to ensure segment comes out of port2
         length1 = radius + xrel if (orel == 0 and xrel > 0) else radius
-        pts = path_U(port1, port2, length1=length1)
-    return pts
+        waypoints = _waypoints_U(pt1, pt2, e1, e_left, length1)
+    return Path(waypoints)
 
 
 def path_Z(port1: Port, port2: Port, length1=100, length2=100) -> Path:
@@ -232,14 +266,20 @@ def path_Z(port1: Port, port2: Port, length1=100, length2=100) -> Path:
 
     """
     # get basis vectors in port directions
-    e1, _ = _get_rotated_basis(port1.orientation)
-    e2, _ = _get_rotated_basis(port2.orientation)
+    e1, _ = _get_rotated_basis_tuples(port1.orientation)
+    e2, _ = _get_rotated_basis_tuples(port2.orientation)
     # assemble route  points
-    pt1 = port1.center
-    pt2 = pt1 + length1 * e1  # outward from port1 by length1
-    pt4 = port2.center
-    pt3 = pt4 + length2 * e2  # outward from port2 by length2
-    return Path(np.array([pt1, pt2, pt3, pt4]))
+    (x1, y1), (x4, y4) = port1.center, port2.center
+    return Path(
+        np.array(
+            [
+                (x1, y1),
+                (x1 + length1 * e1[0], y1 + length1 * e1[1]),  # outward from port1
+                (x4 + length2 * e2[0], y4 + length2 * e2[1]),  # outward from port2
+                (x4, y4),
+            ]
+        )
+    )
 
 
 def path_V(port1: Port, port2: Port) -> Path:
@@ -252,17 +292,20 @@ def path_V(port1: Port, port2: Port) -> Path:
 
     """
     # get basis vectors in port directions
-    e1, _ = _get_rotated_basis(port1.orientation)
-    e2, _ = _get_rotated_basis(port2.orientation)
+    e1, _ = _get_rotated_basis_tuples(port1.orientation)
+    e2, _ = _get_rotated_basis_tuples(port2.orientation)
 
     # assemble route  points
-    pt1 = port1.center
-    pt3 = port2.center
+    (x1, y1), (x3, y3) = port1.center, port2.center
 
-    # solve for intersection
-    E = np.column_stack((e1, -1 * e2))
-    pt2 = np.matmul(np.linalg.inv(E), pt3 - pt1)[0] * e1 + pt1
-    return Path(np.array([pt1, pt2, pt3]))
+    # solve pt1 + t * e1 = pt3 + s * e2 for t with Cramer's rule
+    dx = x3 - x1
+    dy = y3 - y1
+    det = e2[0] * e1[1] - e1[0] * e2[1]
+    if det == 0:
+        raise ValueError(f"path_V ports {port1.name!r} and {port2.name!r} are parallel")
+    t = (e2[0] * dy - e2[1] * dx) / det
+    return Path(np.array([(x1, y1), (x1 + t * e1[0], y1 + t * e1[1]), (x3, y3)]))
 
 
 @gf.cell
@@ -348,6 +391,15 @@ def route_sharp(
     if cross_section:
         cross_section = gf.get_cross_section(cross_section)
         D = P.extrude(cross_section=cross_section)
+    elif width is None and port1.width == port2.width:
+        # equal port widths need no transition
+        cross_section = CrossSection(
+            width=port1.width,
+            port_names=port_names,
+            layer=layer or port1.layer,
+            name="x",
+        )
+        D = P.extrude(cross_section=cross_section)
     elif width is None:
         layer = layer or port1.layer
         X1 = CrossSection(
@@ -362,15 +414,21 @@ def route_sharp(
         D = P.extrude(cross_section=cross_section)
     else:
         D = P.extrude(width=width, layer=layer)
-        if not isinstance(width, CrossSection):
+        widths = None
+        if isinstance(width, (int, float, np.number)) or (
+            isinstance(width, np.ndarray) and width.ndim == 0
+        ):
+            widths = (width, width)
+        elif isinstance(width, Sized):
+            # a 1 element width is a fixed width, a 2 element one goes from start to end
+            if len(width) == 1:
+                widths = (width[0], width[0])
+            elif len(width) == 2:
+                widths = width
+        if widths is not None:
             newport1 = D.add_port(port=port1, name=1).rotate(180)
             newport2 = D.add_port(port=port2, name=2).rotate(180)
-            if np.size(width) == 1:
-                newport1.width = width
-                newport2.width = width
-            if np.size(width) == 2:
-                newport1.width = width[0]
-                newport2.width = width[1]
+            newport1.width, newport2.width = widths
     return D
 
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import pandas as pd
+import csv
 
 import gdsfactory as gf
 from gdsfactory.typings import Component
@@ -9,7 +9,18 @@ debug = True
 nlabels = 12
 
 
+def count_rows(csvpath) -> int:
+    """Returns the number of rows in a CSV file, without the header."""
+    with open(csvpath, newline="") as f:
+        return sum(1 for _ in csv.reader(f)) - 1
+
+
 def mzi_te(**kwargs) -> Component:
+    """Returns an MZI with fiber array and pads.
+
+    Every step is a cell, so repeated calls return the cached components and
+    [mzi_te() for _ in range(n)] costs no more than [mzi_te()] * n.
+    """
     gc = gf.c.grating_coupler_elliptical_tm()
     c = gf.c.mzi_phase_shifter_top_heater_metal(delta_length=40)
     c = gf.routing.add_fiber_array(c, grating_coupler=gc, **kwargs)
@@ -27,8 +38,8 @@ def test_grid() -> Component:
     gdspath = c.write_gds()
     csvpath = gf.labels.write_labels.write_labels_gdstk(gdspath, debug=debug)
 
-    df = pd.read_csv(csvpath)
-    assert len(df) == nlabels, len(df)
+    nrows = count_rows(csvpath)
+    assert nrows == nlabels, nrows
     return c
 
 
@@ -41,8 +52,8 @@ def test_pack() -> Component:
     c = gf.add_labels.add_labels_to_ports(c)
     gdspath = c.write_gds()
     csvpath = gf.labels.write_labels.write_labels_gdstk(gdspath, debug=debug)
-    df = pd.read_csv(csvpath)
-    assert len(df) == nlabels, len(df)
+    nrows = count_rows(csvpath)
+    assert nrows == nlabels, nrows
     return c
 
 
@@ -58,4 +69,4 @@ if __name__ == "__main__":
     # c = gf.add_labels.add_labels_to_ports(c)
     # gdspath = c.write_gds()
     # csvpath = gf.labels.write_labels.write_labels_gdstk(gdspath, debug=debug)
-    # df = pd.read_csv(csvpath)
+    # nrows = count_rows(csvpath)
@@ -58,6 +58,11 @@ def clean_value_json(value: Any) -> Any:
 
     elif isinstance(value, np.ndarray):
         value = np.round(value, DEFAULT_SERIALIZATION_MAX_DIGITS)
+        # tolist() matches the JSON round trip for finite float64 and int arrays
+        if value.dtype.kind in "iu" or (
+            value.dtype == np.float64 and np.isfinite(value).all()
+        ):
+            return value.tolist()
         return orjson.loads(orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY))
     elif callable(value) and isinstance(value, functools.partial):
         sig = inspect.signature(value.func)
@@ -9,15 +9,20 @@ https://www.photonics.intec.ugent.be/contact/people.asp?ID=332
 from __future__ import annotations
 
 import pathlib
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Optional
 
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 import pydantic
-from scipy.interpolate import interp2d
+from scipy.interpolate import SmoothBivariateSpline
 
 from gdsfactory.config import PATH
+from gdsfactory.simulation.get_sparameters_path import get_kwargs_hash
 from gdsfactory.simulation.modes.find_mode_dispersion import find_mode_dispersion
+from gdsfactory.simulation.modes.types import Mode
 
 PATH.modes = pathlib.Path.cwd() / "data"
 
@@ -26,6 +31,10 @@ width0 = 465 * nm
 thickness0 = 215 * nm
 
 
+def _find_mode_dispersion(wg_width: float, wg_thickness: float, **kwargs) -> Mode:
+    return find_mode_dispersion(wg_width=wg_width, wg_thickness=wg_thickness, **kwargs)
+
+
 @pydantic.validate_arguments
 def find_neff_ng_dw_dh(
     width: float = width0,
@@ -37,6 +46,7 @@ def find_neff_ng_dw_dh(
     mode_number: int = 1,
     core: str = "Si",
     clad: str = "SiO2",
+    max_workers: Optional[int] = 1,
     **kwargs,
 ) -> pd.DataFrame:
     """Computes group and effective index for different widths and heights.
@@ -51,6 +61,8 @@ def find_neff_ng_dw_dh(
         mode_number: mode index to compute (1: fundamental mode).
         core: core material name.
         clad: clad material name.
+        max_workers: number of processes to solve the sweep points.
+            1 solves them serially, None uses all CPUs.
 
     Keyword Args:
         wg_thickness: wg height (um).
@@ -70,27 +82,29 @@ def find_neff_ng_dw_dh(
     dw = np.linspace(-delta_width, delta_width, steps)
     dh = np.linspace(-delta_thickness, delta_thickness, steps)
 
-    neffs = []
-    ngs = []
-    dhs = []
-    dws = []
-
-    for dwi in dw:
-        for dhi in dh:
-            m = find_mode_dispersion(
-                core=core,
-                clad=clad,
-                wg_width=width + dwi,
-                wg_thickness=thickness + dhi,
-                wavelength=wavelength,
-                mode_number=mode_number,
-                **kwargs,
-            )
-            neffs.append(m.neff)
-            ngs.append(m.ng)
-            dws.append(dwi)
-            dhs.append(dhi)
+    dws = np.repeat(dw, steps)
+    dhs = np.tile(dh, steps)
+
+    find_mode = partial(
+        _find_mode_dispersion,
+        core=core,
+        clad=clad,
+        wavelength=wavelength,
+        mode_number=mode_number,
+        **kwargs,
+    )
+    widths = width + dws
+    thicknesses = thickness + dhs
 
+    # each sweep point is an independent mode solve
+    if max_workers == 1:
+        modes = list(map(find_mode, widths, thicknesses))
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            modes = list(executor.map(find_mode, widths, thicknesses))
+
+    neffs = np.fromiter((m.neff for m in modes), dtype=float, count=len(modes))
+    ngs = np.fromiter((m.ng for m in modes), dtype=float, count=len(modes))
     return pd.DataFrame(dict(dw=dws, dh=dhs, neff=neffs, ng=ngs))
 
 
@@ -110,7 +124,15 @@ def plot_neff_ng_dw_dh(
         mode_number: 1 is the fundamental first order mode.
 
     """
-    filepath = pathlib.Path(PATH.modes / "mpb_dw_dh_dispersion.csv")
+    settings = dict(
+        width=width,
+        thickness=thickness,
+        wavelength=wavelength,
+        mode_number=mode_number,
+        **kwargs,
+    )
+    h = get_kwargs_hash(**settings)
+    filepath = pathlib.Path(PATH.modes / f"mpb_dw_dh_dispersion_{h}.csv")
     m = find_mode_dispersion(
         wg_width=width, wg_thickness=thickness, wavelength=wavelength
     )
@@ -120,7 +142,7 @@ def plot_neff_ng_dw_dh(
     if filepath.exists():
         df = pd.read_csv(filepath)
     else:
-        df = find_neff_ng_dw_dh(wavelength=wavelength, **kwargs)
+        df = find_neff_ng_dw_dh(**settings)
         cache = filepath.parent
         cache.mkdir(exist_ok=True, parents=True)
         df.to_csv(filepath)
@@ -130,22 +152,16 @@ def plot_neff_ng_dw_dh(
     ngs = df.ng.values
     neffs = df.neff.values
 
-    # neff interpolation
-    f_w = interp2d(neffs, ngs, np.array(dws), kind="cubic")
-    f_h = interp2d(neffs, ngs, np.array(dhs), kind="cubic")
+    # cubic spline through the scattered (neff, ng) samples, same fit as interp2d
+    f_w = SmoothBivariateSpline(neffs, ngs, dws, kx=3, ky=3, s=0)
+    f_h = SmoothBivariateSpline(neffs, ngs, dhs, kx=3, ky=3, s=0)
 
-    ws = width + np.array(dws)
-    hs = thickness + np.array(dhs)
+    ws = width + dws
+    hs = thickness + dhs
 
     plt.plot(ws * 1e3, hs * 1e3, "ko")
-    extracted_dw = []
-    extracted_dh = []
-
-    for neff, ng in zip(neffs, ngs):
-        temp_w = f_w(neff, ng) + width
-        temp_h = f_h(neff, ng) + thickness
-        extracted_dw.append(temp_w * 1e3)
-        extracted_dh.append(temp_h * 1e3)
+    extracted_dw = (f_w.ev(neffs, ngs) + width) * 1e3
+    extracted_dh = (f_h.ev(neffs, ngs) + thickness) * 1e3
 
     plt.plot(extracted_dw, extracted_dh, "rx")
     plt.xlabel("width (nm)")
@@ -6,6 +6,7 @@ import importlib
 import logging
 import pathlib
 import sys
+import threading
 import time
 import traceback
 from typing import Callable, Optional
@@ -16,15 +17,29 @@ from watchdog.observers import Observer
 from gdsfactory.config import cwd
 from gdsfactory.pdk import get_active_pdk
 
+SUFFIXES = (".pic.yml", ".py")
+
 
 class YamlEventHandler(FileSystemEventHandler):
     """Captures pic.yml file change events."""
 
-    def __init__(self, logger=None, path: Optional[str] = None):
-        """Initialize the YAML event handler."""
+    def __init__(
+        self, logger=None, path: Optional[str] = None, debounce: float = 0.2
+    ) -> None:
+        """Initialize the YAML event handler.
+
+        Args:
+            logger: defaults to the root logger.
+            path: directory to register YAML cells from.
+            debounce: seconds to wait for more events on the same file before
+                handling it, so one save that fires several events rebuilds once.
+        """
         super().__init__()
 
         self.logger = logger or logging.root
+        self.debounce = debounce
+        self._timers = {}
+        self._parsed = {}
         pdk = get_active_pdk()
         pdk.register_cells_yaml(dirpath=path, update=True)
 
@@ -44,16 +59,39 @@ class YamlEventHandler(FileSystemEventHandler):
         print(f"Active PDK: {pdk.name}")
         filepath = pathlib.Path(src_path)
         cell_name = filepath.stem.split(".")[0]
+
+        # events that do not change the file (touch, repeated saves) reuse the cell
+        stat = filepath.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        parsed = self._parsed.get(filepath)
+        if parsed and parsed[0] == signature:
+            return parsed[1]
+
         if cell_name in CACHE:
             CACHE.pop(cell_name)
         parser = pdk.circuit_yaml_parser
         function = parser(filepath, name=cell_name)
         try:
             pdk.register_cells_yaml(**{cell_name: function}, update=update)
+            # only a registered cell may be reused, a failed one is retried
+            self._parsed[filepath] = (signature, function)
         except ValueError as e:
             print(e)
         return function
 
+    def _debounce(self, src_path: str, function: Callable) -> None:
+        """Calls function once src_path had no new events for debounce seconds."""
+        timer = self._timers.pop(src_path, None)
+        if timer:
+            timer.cancel()
+        if self.debounce <= 0:
+            function()
+            return
+        timer = threading.Timer(self.debounce, function)
+        timer.daemon = True
+        self._timers[src_path] = timer
+        timer.start()
+
     def on_moved(self, event):
         super().on_moved(event)
 
@@ -69,8 +107,11 @@ class YamlEventHandler(FileSystemEventHandler):
         what = "directory" if event.is_directory else "file"
         if what == "file" and event.src_path.endswith(".pic.yml"):
             self.logger.info("Created %s: %s", what, event.src_path)
-            self.update_cell(event.src_path)
-            self.get_component(event.src_path)
+            self._debounce(event.src_path, lambda: self._on_created(event.src_path))
+
+    def _on_created(self, src_path) -> None:
+        self.update_cell(src_path)
+        self.get_component(src_path)
 
     def on_deleted(self, event):
         super().on_deleted(event)
@@ -88,13 +129,9 @@ class YamlEventHandler(FileSystemEventHandler):
         super().on_modified(event)
 
         what = "directory" if event.is_directory else "file"
-        if (
-            what == "file"
-            and event.src_path.endswith(".pic.yml")
-            or event.src_path.endswith(".py")
-        ):
+        if what == "file" and event.src_path.endswith(SUFFIXES):
             self.logger.info("Modified %s: %s", what, event.src_path)
-            self.get_component(event.src_path)
+            self._debounce(event.src_path, lambda: self.get_component(event.src_path))
 
     def get_component(self, filepath):
         try:
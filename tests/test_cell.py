@@ -21,6 +21,22 @@ def test_validator_error() -> None:
         _dummy2(length="error")
 
 
+_calls = []
+
+
+@gf.cell
+def _dummy_counted(length: float = 3.0) -> gf.Component:
+    _calls.append(length)
+    return gf.Component()
+
+
+def test_cached_cell_body_runs_once() -> None:
+    c1 = _dummy_counted(length=2000.0)
+    c2 = _dummy_counted(length=2000.0)
+    assert c1 is c2
+    assert _calls.count(2000.0) == 1, _calls
+
+
 if __name__ == "__main__":
     # test_raise_error_args()
     test_validator_error()
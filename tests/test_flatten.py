@@ -60,6 +60,17 @@ def test_flatten_single_layer():
         assert (p.layer, p.datatype) == target_layer
 
 
+def test_litho_ruler_is_flat():
+    c = gf.components.litho_ruler(num_marks=5, spacing=2.0, height=2, scale=(3, 1))
+    assert len(c.references) == 0, f"{len(c.references)}"
+
+    polygons = c.get_polygons()
+    assert len(polygons) == 5, len(polygons)
+    assert c.xmin == 0
+    assert c.xmax == 4 * 2.0 + 0.5
+    assert c.ymax == 6
+
+
 if __name__ == "__main__":
     test_flattened_cell_keeps_ports()
     # c1 = gf.components.mzi()
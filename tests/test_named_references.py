@@ -29,6 +29,16 @@ def test_fail_when_alias_exists():
         ref2.name = "straight_1"
 
 
+def test_named_references_add_list():
+    c = gf.Component("component_with_fill")
+    s = gf.components.straight()
+    refs = [gf.ComponentReference(s, origin=(10 * i, 0)) for i in range(3)]
+    c.add(refs)
+    assert len(c.named_references) == 3
+    assert len(c.references) == 3
+    assert len(c._cell.references) == 3
+
+
 if __name__ == "__main__":
     # test_fail_when_alias_exists()
     # test_named_references_with_alias()
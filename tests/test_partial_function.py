@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import gdsfactory as gf
+from gdsfactory.components.mzi import mzi1x2, mzi1x2_2x2, mzi2x2_2x2, mzi_coupler
 
 
 def test_partial_function_with_kwargs() -> None:
@@ -34,6 +35,13 @@ def test_partial_function_without_kwargs() -> None:
     assert c1.name == c2.name == c3.name, f"{c1.name} == {c2.name} == {c3.name}"
 
 
+def test_partial_default_build_is_cached() -> None:
+    for mzi in (mzi1x2, mzi2x2_2x2, mzi1x2_2x2, mzi_coupler):
+        c1 = mzi()
+        c2 = mzi()
+        assert c1 is c2, f"{c1.name} was built twice"
+
+
 if __name__ == "__main__":
     # test_partial_function_with_kwargs()
     test_partial_function_without_kwargs()